@@ -22,6 +22,7 @@ HEALTH_BAR_BORDER = 2
 HEALTH_BAR_COLOR = (0, 255, 0)  # Green
 HEALTH_BAR_BACKGROUND_COLOR = (100, 100, 100)  # Gray
 HEALTH_BAR_BORDER_COLOR = (255, 255, 255)  # White
+HEALTH_TEXT_CACHE_SIZE = 16  # Max cached "Health: x/y" text surfaces
 
 # Asteroid settings
 ASTEROID_SIZES = {
@@ -29,6 +30,8 @@ ASTEROID_SIZES = {
     "medium": {"min": 26, "max": 40},
     "large": {"min": 41, "max": 60}
 }
+ASTEROID_SIZE_VARIANTS = 3  # Distinct sizes per category, so asteroids share images
+ASTEROID_ROTATION_STEP = 4  # Degrees between pre-rotated asteroid images
 ASTEROID_MIN_SPEED = 50
 ASTEROID_MAX_SPEED = 200
 ASTEROID_SPAWN_RATE = 0.5  # Seconds between spawns (average)
@@ -111,6 +114,7 @@ STAR_SPEEDS = [20, 40, 60]  # Different star speeds
 # Countdown timer settings
 COUNTDOWN_DURATION = 3  # seconds
 COUNTDOWN_FONT_SIZE = 120
+COUNTDOWN_MIN_FONT_SIZE = 20  # Smallest size used by the number scale animation
 COUNTDOWN_COLOR = (255, 255, 255)  # White
 
 # Scene transition settings
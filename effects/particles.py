@@ -158,14 +158,76 @@ class ParticleSystem:
                 x, y, color, velocity, size, lifetime, gravity, fade
             ))
     
+    def emit_particles_batch(self, xs, ys, vxs, vys, color_range, size_range=None,
+                             lifetime_range=None, velocity_jitter=0.0, gravity=False, fade=True):
+        """Emit one particle per entry of the given position/velocity sequences in a single call.
+        
+        Args:
+            xs: X coordinates, one per particle
+            ys: Y coordinates, one per particle
+            vxs: Base X velocities, one per particle
+            vys: Base Y velocities, one per particle
+            color_range: List of possible colors to choose from
+            size_range: (min_size, max_size) for random sizes
+            lifetime_range: (min_lifetime, max_lifetime) for random lifetimes
+            velocity_jitter: Fractional random spread applied to each velocity component
+                (0.1 picks from 0.9x to 1.1x)
+            gravity: Whether particles are affected by gravity
+            fade: Whether particles fade out over time
+        """
+        if size_range is None:
+            size_range = (1, 3)
+            
+        if lifetime_range is None:
+            lifetime_range = (0.5, 1.5)
+            
+        # Only create as many particles as there is room for
+        room = self.max_particles - len(self.particles)
+        if room <= 0:
+            return
+            
+        # Bind lookups used in the loop to locals
+        uniform = random.uniform
+        choice = random.choice
+        min_size, max_size = size_range
+        min_life, max_life = lifetime_range
+        low = 1.0 - velocity_jitter
+        high = 1.0 + velocity_jitter
+        
+        new_particles = []
+        for x, y, vx, vy in zip(xs, ys, vxs, vys):
+            if len(new_particles) >= room:
+                break
+            new_particles.append(Particle(
+                x, y, choice(color_range),
+                (uniform(vx * low, vx * high), uniform(vy * low, vy * high)),
+                uniform(min_size, max_size), uniform(min_life, max_life),
+                gravity, fade
+            ))
+        self.particles.extend(new_particles)
+    
     def update(self, dt):
         """Update all particles in the system.
         
         Args:
             dt: Time delta in seconds
         """
-        # Update particles and remove dead ones
-        self.particles = [p for p in self.particles if p.update(dt)]
+        # Inlined Particle.update to avoid a method call per particle
+        gravity_step = 50 * dt  # Gravity acceleration
+        alive = []
+        keep = alive.append
+        for particle in self.particles:
+            velocity = particle.velocity
+            particle.x += velocity.x * dt
+            particle.y += velocity.y * dt
+            if particle.gravity:
+                velocity.y += gravity_step
+            particle.age += dt
+            
+            # Keep only particles that are still alive
+            if particle.age < particle.lifetime:
+                keep(particle)
+        self.particles = alive
         
     def draw(self, surface):
         """Draw all particles in the system.
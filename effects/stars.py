@@ -8,6 +8,37 @@ from constants import (
     NUM_STARS, STAR_SIZES, STAR_COLORS, STAR_SPEEDS
 )
 
+# Pre-rendered star sprites keyed by (size, color, opacity); opacity is the
+# single field-wide value set through StarField.set_opacity
+_star_sprite_cache = {}
+
+def get_star_sprite(size, color, opacity):
+    """Get a cached star sprite, rendering it on first use.
+    
+    Args:
+        size: Star size in pixels
+        color: RGB color tuple
+        opacity: Alpha value (0-255), the StarField's shared opacity
+        
+    Returns:
+        Pygame surface with the star drawn on it
+    """
+    key = (size, color, opacity)
+    sprite = _star_sprite_cache.get(key)
+    if sprite is None:
+        color_with_opacity = (*color, opacity)
+        if size == 1:
+            # Tiny star is a single pixel
+            sprite = pygame.Surface((1, 1), pygame.SRCALPHA)
+            sprite.fill(color_with_opacity)
+        else:
+            # Larger star is a circle
+            radius = size // 2
+            sprite = pygame.Surface((size + 2, size + 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color_with_opacity, (radius + 1, radius + 1), radius)
+        _star_sprite_cache[key] = sprite
+    return sprite
+
 class Star:
     """Individual star object for background effect."""
     
@@ -26,7 +57,6 @@ class Star:
         self.size = random.choice(STAR_SIZES)
         self.color = random.choice(STAR_COLORS)
         self.speed = random.choice(STAR_SPEEDS)
-        self.opacity = 153  # 60% of 255 for reduced opacity
         
     def update(self, dt):
         """Update the star position.
@@ -42,27 +72,15 @@ class Star:
             self.y = 0
             self.x = random.randint(0, self.screen_width)
             
-    def draw(self, surface):
+    def draw(self, surface, opacity):
         """Draw the star to the surface.
         
         Args:
             surface: Pygame surface to draw on
+            opacity: Alpha value (0-255), shared by every star in a StarField
         """
-        # Apply opacity
-        color_with_opacity = (*self.color, self.opacity)
-        
-        # Draw the star as a small rect or circle based on size
-        if self.size == 1:
-            # Draw tiny star as a single pixel with opacity
-            pixel_surface = pygame.Surface((1, 1), pygame.SRCALPHA)
-            pixel_surface.fill(color_with_opacity)
-            surface.blit(pixel_surface, (int(self.x), int(self.y)))
-        else:
-            # Draw larger star as a circle with opacity
-            radius = self.size // 2
-            star_surface = pygame.Surface((self.size + 2, self.size + 2), pygame.SRCALPHA)
-            pygame.draw.circle(star_surface, color_with_opacity, (radius + 1, radius + 1), radius)
-            surface.blit(star_surface, (int(self.x), int(self.y)))
+        surface.blit(get_star_sprite(self.size, self.color, opacity),
+                     (int(self.x), int(self.y)))
 
 class StarField:
     """Collection of stars for background effect."""
@@ -81,6 +99,9 @@ class StarField:
         self.stars = []
         for _ in range(num_stars):
             self.stars.append(Star(self.screen_width, self.screen_height))
+        
+        # Every star in the field shares one opacity, so settings changes are a single write
+        self.opacity = 153  # 60% of 255 for reduced opacity
     
     def update(self, dt):
         """Update all stars.
@@ -88,8 +109,15 @@ class StarField:
         Args:
             dt: Time delta in seconds
         """
+        # Inlined Star.update to avoid a method call per star
+        screen_width = self.screen_width
+        screen_height = self.screen_height
+        randint = random.randint
         for star in self.stars:
-            star.update(dt)
+            star.y += star.speed * dt
+            if star.y > screen_height:
+                star.y = 0
+                star.x = randint(0, screen_width)
     
     def draw(self, surface):
         """Draw all stars.
@@ -97,18 +125,21 @@ class StarField:
         Args:
             surface: Pygame surface to draw on
         """
-        for star in self.stars:
-            star.draw(surface)
+        # Blit all cached star sprites in a single call
+        opacity = self.opacity
+        surface.blits([(get_star_sprite(star.size, star.color, opacity),
+                        (int(star.x), int(star.y)))
+                       for star in self.stars], doreturn=False)
             
     def set_opacity(self, opacity_percent):
         """Set the opacity for all stars.
         
+        Stars hold no opacity of their own; draw picks sprites for this value.
+        
         Args:
             opacity_percent: Opacity as a percentage (0-100)
         """
-        opacity = int(opacity_percent * 255 / 100)
-        for star in self.stars:
-            star.opacity = opacity 
+        self.opacity = int(opacity_percent * 255 / 100)
             
     def set_screen_size(self, width, height):
         """Update the screen size for all stars.
@@ -5,6 +5,7 @@ with support for multiple image resolutions based on screen size.
 """
 import os
 import pygame
+from engine.music_fader import MusicFader
 from constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, PLAYER_SIZE, ASTEROID_SIZES,
     SCORE_FONT_SIZE, GAME_OVER_FONT_SIZE, TITLE_FONT_SIZE, 
@@ -24,6 +25,7 @@ class AssetLoader:
         self.fonts = {}   # Cache for fonts
         self.text_renderer = None  # Will be set by the Game class
         self.assets = None  # Will be populated by load_game_assets
+        self.music_fader = MusicFader()  # Non-blocking music transitions
         
         # Determine appropriate image size based on screen dimensions
         if SCREEN_WIDTH <= 640:
@@ -217,6 +219,8 @@ class AssetLoader:
     def play_music(self, music_path, volume=0.5, loops=-1, fade_ms=1000):
         """
         Start playing music with optional fade-in.
+        If music is already playing it is faded out first; the new track
+        starts from update_music() instead of blocking the main loop.
         
         Args:
             music_path: Path to the music file
@@ -224,17 +228,13 @@ class AssetLoader:
             loops: Number of times to loop (-1 for infinite)
             fade_ms: Fade-in time in milliseconds
         """
-        if pygame.mixer.music.get_busy():
-            pygame.mixer.music.fadeout(fade_ms)
-            pygame.time.delay(fade_ms // 2)  # Wait for half the fade out time
-            
-        try:
-            pygame.mixer.music.load(music_path)
-            pygame.mixer.music.set_volume(volume)
-            pygame.mixer.music.play(loops=loops, fade_ms=fade_ms)
-            
-        except pygame.error as e:
-            print(f"Error playing music {music_path}: {e}")
+        self.music_fader.start(music_path, volume=volume, loops=loops, fade_ms=fade_ms)
+    
+    def update_music(self):
+        """
+        Advance any pending music transition. Call once per frame.
+        """
+        self.music_fader.tick()
     
     def stop_music(self, fade_ms=1000):
         """
@@ -243,6 +243,7 @@ class AssetLoader:
         Args:
             fade_ms: Fade-out time in milliseconds
         """
+        self.music_fader.cancel()
         pygame.mixer.music.fadeout(fade_ms)
     
     def create_text_logo(self, text="FINAL ESCAPE", size=TITLE_FONT_SIZE, color=(255, 255, 255)):
@@ -477,6 +478,17 @@ class AssetLoader:
         
         return self.assets
         
+    def get_game_assets(self):
+        """
+        Get the loaded game assets, loading them on first use.
+        
+        Returns:
+            Dictionary containing all loaded assets
+        """
+        if self.assets is None:
+            self.load_game_assets()
+        return self.assets
+        
     def get_text_renderer(self):
         """Get the text renderer instance."""
         return self.text_renderer
@@ -0,0 +1,57 @@
+"""
+Non-blocking music transitions for Final Escape.
+Fades out the current track and starts the next one once the fade-out
+deadline has passed, without stalling the main loop.
+"""
+import pygame
+
+
+class MusicFader:
+    """
+    Small state machine that cross-fades between music tracks.
+    """
+    def __init__(self):
+        self.pending = None  # (music_path, volume, loops, fade_ms, deadline) or None
+
+    def start(self, music_path, volume=0.5, loops=-1, fade_ms=1000):
+        """
+        Begin a transition to a new music track.
+        
+        Args:
+            music_path: Path to the music file
+            volume: Volume level (0.0 to 1.0)
+            loops: Number of times to loop (-1 for infinite)
+            fade_ms: Fade time in milliseconds
+        """
+        if pygame.mixer.music.get_busy():
+            pygame.mixer.music.fadeout(fade_ms)
+            # Start the new track after half the fade out time
+            deadline = pygame.time.get_ticks() + fade_ms // 2
+            self.pending = (music_path, volume, loops, fade_ms, deadline)
+        else:
+            self.pending = None
+            self._play(music_path, volume, loops, fade_ms)
+
+    def tick(self):
+        """
+        Start the pending track once its deadline has passed. Call once per frame.
+        """
+        if self.pending is None:
+            return
+        music_path, volume, loops, fade_ms, deadline = self.pending
+        if pygame.time.get_ticks() >= deadline:
+            self.pending = None
+            self._play(music_path, volume, loops, fade_ms)
+
+    def cancel(self):
+        """Drop any track that is waiting to start."""
+        self.pending = None
+
+    def _play(self, music_path, volume, loops, fade_ms):
+        try:
+            pygame.mixer.music.load(music_path)
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play(loops=loops, fade_ms=fade_ms)
+            
+        except pygame.error as e:
+            print(f"Error playing music {music_path}: {e}")
@@ -2,6 +2,8 @@
 Utility functions for the Asteroid Navigator game.
 """
 import random
+from functools import lru_cache
+import pygame
 
 def weighted_random_choice(weights_dict):
     """
@@ -11,21 +13,147 @@ def weighted_random_choice(weights_dict):
         weights_dict: Dictionary with keys as options and values as weights.
         
     Returns:
-        A randomly selected key based on the weights.
+        A randomly selected key based on the weights, or None if the dictionary is empty.
     """
-    options = list(weights_dict.keys())
+    if not weights_dict:
+        return None
+    
     weights = list(weights_dict.values())
     
-    # Generate a random value based on the sum of weights
-    total = sum(weights)
-    rand_val = random.uniform(0, total)
+    # Fallback to the first option when the weights sum to 0 (random.choices would raise)
+    if sum(weights) <= 0:
+        return next(iter(weights_dict))
+    
+    # random.choices bisects the cumulative weights in C
+    return random.choices(list(weights_dict), weights=weights, k=1)[0] 
+
+
+@lru_cache(maxsize=8)
+def _alpha_per_second(duration):
+    """
+    Get the alpha change per second for a fade of the given duration.
+    
+    Args:
+        duration: Fade duration in seconds.
+        
+    Returns:
+        255 divided by the duration.
+    """
+    return 255.0 / duration
+
+def fade_in_alpha(elapsed, duration):
+    """
+    Get the alpha for a layer fading in (e.g. a fade-to-black overlay).
+    
+    Args:
+        elapsed: Time since the fade started, in seconds.
+        duration: Fade duration in seconds.
+        
+    Returns:
+        Alpha value from 0 (start) rising to 255 (end).
+    """
+    return min(255, int(elapsed * _alpha_per_second(duration)))
+
+def fade_out_alpha(elapsed, duration):
+    """
+    Get the alpha for a layer fading out.
+    
+    Args:
+        elapsed: Time since the fade started, in seconds.
+        duration: Fade duration in seconds.
+        
+    Returns:
+        Alpha value from 255 (start) falling to 0 (end).
+    """
+    return max(0, 255 - int(elapsed * _alpha_per_second(duration)))
+
+def convert_text_surface(text_surface):
+    """
+    Convert a rendered text surface to the display format for faster blits.
+    Surfaces rendered before a display mode is set are returned unchanged.
+    
+    Args:
+        text_surface: Surface returned by Font.render.
+        
+    Returns:
+        Converted pygame Surface with per-pixel alpha.
+    """
+    if pygame.display.get_surface() is None:
+        return text_surface
+    return text_surface.convert_alpha()
+
+def render_cached_text(cache, font, text, color):
+    """
+    Render antialiased text, reusing the surface from an earlier identical call.
+    The returned surface is shared, so callers must set its alpha before every blit.
+    
+    Args:
+        cache: Dictionary owned by the caller, keyed by (font id, text, color).
+        font: Font to render with.
+        text: Text to render.
+        color: Text color.
+        
+    Returns:
+        Rendered text surface, converted to the display format.
+    """
+    key = (id(font), text, color)
+    text_surface = cache.get(key)
+    if text_surface is None:
+        text_surface = convert_text_surface(font.render(text, True, color))
+        cache[key] = text_surface
+    return text_surface
+
+def convert_opaque_surface(surface):
+    """
+    Convert a surface without per-pixel alpha to the display format for faster blits.
+    Surfaces created before a display mode is set are returned unchanged.
     
-    # Find the option that corresponds to the random value
-    cumulative = 0
-    for i, weight in enumerate(weights):
-        cumulative += weight
-        if rand_val <= cumulative:
-            return options[i]
+    Args:
+        surface: Opaque pygame Surface (surface alpha may still be set later).
+        
+    Returns:
+        Converted pygame Surface.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert()
+
+def create_fade_surface(width, height, color=(0, 0, 0)):
+    """
+    Get an opaque full-screen surface for fade transitions.
+    Fading is done with set_alpha, so no per-pixel alpha is needed. Once a
+    display mode is set the surface is converted to the display format so
+    blits use the fast path.
+    
+    Surfaces are shared between callers asking for the same size and color,
+    so callers must set the alpha they need before every blit.
+    
+    Args:
+        width: Surface width in pixels.
+        height: Surface height in pixels.
+        color: RGB fill color.
+        
+    Returns:
+        Filled pygame Surface.
+    """
+    return _build_fade_surface(width, height, tuple(color), pygame.display.get_surface() is not None)
+
+@lru_cache(maxsize=4)
+def _build_fade_surface(width, height, color, convert):
+    """
+    Build a fade surface; memoized by create_fade_surface.
     
-    # Fallback (shouldn't reach here unless weights sum to 0)
-    return options[0] if options else None 
\ No newline at end of file
+    Args:
+        width: Surface width in pixels.
+        height: Surface height in pixels.
+        color: RGB fill color tuple.
+        convert: Whether to convert the surface to the display format.
+        
+    Returns:
+        Filled pygame Surface.
+    """
+    fade_surface = pygame.Surface((width, height))
+    fade_surface.fill(color)
+    if convert:
+        fade_surface = fade_surface.convert()
+    return fade_surface
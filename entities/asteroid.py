@@ -5,20 +5,57 @@ import pygame
 import random
 import math
 import os
+from functools import lru_cache
 from pygame.math import Vector2
 from constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
     ASTEROID_SIZES, ASTEROID_MIN_SPEED, ASTEROID_MAX_SPEED,
     ASTEROID_SPEED_MULTIPLIERS, ASTEROID_TYPE_WEIGHTS,
     ASTEROID_SIZE_RESTRICTIONS, ASTEROID_BASE_DAMAGE,
-    ASTEROID_SIZE_DAMAGE_MULTIPLIERS, ASTEROID_PARTICLE_COLORS
+    ASTEROID_SIZE_DAMAGE_MULTIPLIERS, ASTEROID_PARTICLE_COLORS,
+    ASTEROID_SIZE_VARIANTS, ASTEROID_ROTATION_STEP, DIFFICULTY_SIZE_RESTRICTIONS
 )
 from engine.utils import weighted_random_choice
 
+# Evenly spaced sizes each category snaps to, keyed by size category
+_SIZE_CHOICES = {
+    category: tuple(
+        round(size_range["min"] + (size_range["max"] - size_range["min"]) * i / (ASTEROID_SIZE_VARIANTS - 1))
+        for i in range(ASTEROID_SIZE_VARIANTS)
+    )
+    for category, size_range in ASTEROID_SIZES.items()
+}
+
+# Rotated images kept in memory: every (type, size) variant one difficulty can
+# spawn, at every rotation step, so a game never evicts its own rotations
+_ROTATION_CACHE_SIZE = (
+    max(sum(len(sizes) for sizes in restrictions.values())
+        for restrictions in DIFFICULTY_SIZE_RESTRICTIONS.values())
+    * ASTEROID_SIZE_VARIANTS * (360 // ASTEROID_ROTATION_STEP)
+)
+
+@lru_cache(maxsize=_ROTATION_CACHE_SIZE)
+def _rotated_image(image, angle_bucket):
+    """Rotate an asteroid image, sharing the result between asteroids.
+    
+    Asteroids of the same type, size and difficulty share one image_original
+    (via the pool), so each rotation step is computed once per variant. Sizes
+    are snapped to ASTEROID_SIZE_VARIANTS per category to keep the number of
+    variants small enough for the cache to hold them.
+    
+    Args:
+        image: Source asteroid surface
+        angle_bucket: Rotation in units of ASTEROID_ROTATION_STEP degrees
+        
+    Returns:
+        Rotated surface (must not be modified)
+    """
+    return pygame.transform.rotozoom(image, angle_bucket * ASTEROID_ROTATION_STEP, 1.0)
+
 class Asteroid(pygame.sprite.Sprite):
     """Asteroid class representing obstacles the player must avoid."""
     
-    def __init__(self, particle_system, asset_loader, type_id=None, size_category=None, difficulty="Normal Space", screen_width=None, screen_height=None):
+    def __init__(self, particle_system, asset_loader, type_id=None, size_category=None, difficulty="Normal Space", screen_width=None, screen_height=None, pool=None):
         """Initialize an asteroid with random properties.
         
         Args:
@@ -29,18 +66,31 @@ class Asteroid(pygame.sprite.Sprite):
             difficulty: Current game difficulty level
             screen_width: Width of the screen (defaults to SCREEN_WIDTH from constants)
             screen_height: Height of the screen (defaults to SCREEN_HEIGHT from constants)
+            pool: Optional AsteroidPool this asteroid returns to when killed
         """
         super().__init__()
         
-        # Store the difficulty
-        self.difficulty = difficulty
-        
         # Store screen dimensions
         self.screen_width = screen_width if screen_width is not None else SCREEN_WIDTH
         self.screen_height = screen_height if screen_height is not None else SCREEN_HEIGHT
         
         # Particle system for effects
         self.particle_system = particle_system
+        self.asset_loader = asset_loader
+        self.pool = pool
+        
+        self.reinit(type_id, size_category, difficulty)
+        
+    def reinit(self, type_id=None, size_category=None, difficulty="Normal Space"):
+        """Give the asteroid a fresh set of random properties, reusing this object.
+        
+        Args:
+            type_id: Optional specific asteroid type (0-6) to use
+            size_category: Optional specific size category to use
+            difficulty: Current game difficulty level
+        """
+        # Store the difficulty
+        self.difficulty = difficulty
         
         # Determine the asteroid type (0-6) based on weighted probability or provided value
         if type_id is not None:
@@ -55,26 +105,34 @@ class Asteroid(pygame.sprite.Sprite):
             allowed_sizes = ASTEROID_SIZE_RESTRICTIONS[self.asteroid_type]
             self.size_category = random.choice(allowed_sizes)
         
-        # Calculate actual size based on category
-        size_range = ASTEROID_SIZES[self.size_category]
-        self.actual_size = random.randint(size_range["min"], size_range["max"])
-        
-        # Load and scale asteroid image using relative path
-        relative_asteroid_path = f"a{self.asteroid_type}.png"
-        # Ensure we load with proper transparency
-        self.image_original = asset_loader.load_image(
-            relative_asteroid_path, 
-            convert_alpha=True,
-            scale=(self.actual_size, self.actual_size)
-        )
-        
-        # Create a fresh surface with proper alpha to hold our asteroid
-        temp_surface = pygame.Surface((self.actual_size, self.actual_size), pygame.SRCALPHA)
-        temp_surface.blit(self.image_original, (0, 0))
-        self.image_original = temp_surface
+        # Pick one of the category's fixed sizes so image variants are shared
+        self.actual_size = random.choice(_SIZE_CHOICES[self.size_category])
         
-        # Add difficulty-based visual effects
-        self._apply_difficulty_effects()
+        # Reuse the processed image if the pool already built this variant
+        image_key = (self.asteroid_type, self.actual_size, self.difficulty)
+        cached_image = self.pool.get_image(image_key) if self.pool else None
+        if cached_image is not None:
+            self.image_original = cached_image
+        else:
+            # Load and scale asteroid image using relative path
+            relative_asteroid_path = f"a{self.asteroid_type}.png"
+            # Ensure we load with proper transparency
+            self.image_original = self.asset_loader.load_image(
+                relative_asteroid_path, 
+                convert_alpha=True,
+                scale=(self.actual_size, self.actual_size)
+            )
+            
+            # Create a fresh surface with proper alpha to hold our asteroid
+            temp_surface = pygame.Surface((self.actual_size, self.actual_size), pygame.SRCALPHA)
+            temp_surface.blit(self.image_original, (0, 0))
+            self.image_original = temp_surface
+            
+            # Add difficulty-based visual effects
+            self._apply_difficulty_effects()
+            
+            if self.pool:
+                self.pool.store_image(image_key, self.image_original)
         
         self.image = self.image_original.copy()
         
@@ -112,6 +170,7 @@ class Asteroid(pygame.sprite.Sprite):
         
         # Rotation properties
         self.rotation = 0
+        self._rotation_bucket = None  # Rotation step of the current image
         self.rotation_speed = random.uniform(-50, 50)  # Degrees per second
         
         # Collision properties
@@ -127,6 +186,14 @@ class Asteroid(pygame.sprite.Sprite):
         self.particle_cooldown = 0
         self.particle_rate = 0.08  # Seconds between particle emissions
         
+    def kill(self):
+        """Remove the asteroid from all groups and return it to its pool."""
+        # Only release live asteroids so a double kill can't hand the same object out twice
+        was_alive = self.alive()
+        super().kill()
+        if was_alive and self.pool:
+            self.pool.release(self)
+    
     def _apply_difficulty_effects(self):
         """Apply visual effects to asteroids based on difficulty level."""
         # Skip for lowest difficulty
@@ -222,17 +289,14 @@ class Asteroid(pygame.sprite.Sprite):
         self.rect.center = self.position
         
         # Update rotation
-        self.rotation += self.rotation_speed * dt
+        self.rotation = (self.rotation + self.rotation_speed * dt) % 360
         
-        # Create rotated image with proper alpha transparency
-        rotated_img = pygame.transform.rotozoom(self.image_original, self.rotation, 1.0)
-        
-        # Keep track of the old center
-        old_center = self.rect.center
-        
-        # Update image and rect
-        self.image = rotated_img
-        self.rect = self.image.get_rect(center=old_center)
+        # Swap in the shared pre-rotated image when the rotation crosses a step
+        rotation_bucket = int(self.rotation // ASTEROID_ROTATION_STEP)
+        if rotation_bucket != self._rotation_bucket:
+            self._rotation_bucket = rotation_bucket
+            self.image = _rotated_image(self.image_original, rotation_bucket)
+            self.rect = self.image.get_rect(center=self.rect.center)
         
         # Remove if off screen with buffer
         buffer = self.actual_size * 2
@@ -344,4 +408,70 @@ class Asteroid(pygame.sprite.Sprite):
                     size_range=(min_size, max_size),
                     lifetime_range=(min_lifetime, max_lifetime),
                     fade=True
-                ) 
\ No newline at end of file
+                )
+
+class AsteroidPool:
+    """Recycles Asteroid objects and their processed images between spawns."""
+    
+    def __init__(self, particle_system, asset_loader, screen_width=None, screen_height=None):
+        """Initialize an empty pool.
+        
+        Args:
+            particle_system: ParticleSystem instance passed to new asteroids
+            asset_loader: AssetLoader instance passed to new asteroids
+            screen_width: Width of the screen (defaults to SCREEN_WIDTH from constants)
+            screen_height: Height of the screen (defaults to SCREEN_HEIGHT from constants)
+        """
+        self.particle_system = particle_system
+        self.asset_loader = asset_loader
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self._free = []  # Killed asteroids ready for reuse
+        self._images = {}  # Processed images keyed by (type_id, actual_size, difficulty)
+        
+    def acquire(self, type_id=None, size_category=None, difficulty="Normal Space"):
+        """Get an asteroid with fresh random properties.
+        
+        Args:
+            type_id: Optional specific asteroid type (0-6) to use
+            size_category: Optional specific size category to use
+            difficulty: Current game difficulty level
+            
+        Returns:
+            Asteroid instance, recycled when one is available
+        """
+        if self._free:
+            asteroid = self._free.pop()
+            asteroid.reinit(type_id, size_category, difficulty)
+            return asteroid
+        return Asteroid(
+            self.particle_system,
+            self.asset_loader,
+            type_id=type_id,
+            size_category=size_category,
+            difficulty=difficulty,
+            screen_width=self.screen_width,
+            screen_height=self.screen_height,
+            pool=self
+        )
+        
+    def release(self, asteroid):
+        """Return a killed asteroid to the pool.
+        
+        Args:
+            asteroid: Asteroid that is no longer in any sprite group
+        """
+        self._free.append(asteroid)
+        
+    def get_image(self, key):
+        """Get a processed asteroid image, or None if not built yet."""
+        return self._images.get(key)
+        
+    def store_image(self, key, image):
+        """Remember a processed asteroid image for later spawns."""
+        self._images[key] = image
+        
+    def clear_images(self):
+        """Drop cached images, e.g. when the difficulty changes."""
+        self._images.clear()
+        _rotated_image.cache_clear()
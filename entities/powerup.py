@@ -63,7 +63,7 @@ class PowerUpGroup(pygame.sprite.Group):
 class PowerUp(pygame.sprite.Sprite):
     """PowerUp class representing collectible items with special effects."""
 
-    def __init__(self, initial_position, powerup_type_id, powerup_image_surface, screen_width, screen_height, amount=None):
+    def __init__(self, initial_position, powerup_type_id, powerup_image_surface, screen_width, screen_height, amount=None, pool=None):
         """Initialize a power-up.
 
         Args:
@@ -73,9 +73,25 @@ class PowerUp(pygame.sprite.Sprite):
             screen_width (int): Width of the game screen.
             screen_height (int): Height of the game screen.
             amount (int): Amount for health power-ups.
+            pool (PowerUpPool): Optional pool this power-up returns to when killed.
         """
         super().__init__()
         
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.pool = pool
+        
+        self.reinit(initial_position, powerup_type_id, powerup_image_surface, amount)
+
+    def reinit(self, initial_position, powerup_type_id, powerup_image_surface, amount=None):
+        """Reset the power-up to a freshly spawned state, reusing this object.
+
+        Args:
+            initial_position (tuple): The (x, y) coordinates for the power-up.
+            powerup_type_id (str): The identifier for the type of power-up (e.g., "boom").
+            powerup_image_surface (pygame.Surface): The pre-loaded image for this power-up.
+            amount (int): Amount for health power-ups.
+        """
         self.type_id = powerup_type_id
         self.amount = amount  # For health power-ups
         if powerup_image_surface is None:
@@ -95,8 +111,6 @@ class PowerUp(pygame.sprite.Sprite):
         # For now, let's make them stationary or drift slowly
         self.velocity = Vector2(random.uniform(-20, 20), random.uniform(20, 50)) # Slow downward drift
 
-        self.screen_width = screen_width
-        self.screen_height = screen_height
         self.radius = self.rect.width // 2
         
         # Get color theme for this powerup type
@@ -118,7 +132,15 @@ class PowerUp(pygame.sprite.Sprite):
         # Occasionally emit particles for more visibility
         self.particle_timer = 0
         self.particle_interval = random.uniform(0.3, 0.7)  # Random interval between particle bursts
+        self.emit_particles = False
 
+    def kill(self):
+        """Remove the power-up from all groups and return it to its pool."""
+        # Only release live power-ups so a double kill can't hand the same object out twice
+        was_alive = self.alive()
+        super().kill()
+        if was_alive and self.pool:
+            self.pool.release(self)
 
     def update(self, dt, joystick=None): # joystick is unused but often part of group update signatures
         """Update the power-up's position and state.
@@ -150,7 +172,7 @@ class PowerUp(pygame.sprite.Sprite):
         if self.particle_timer <= 0:
             self.particle_timer = self.particle_interval
             # Signal that we need to emit particles - actual emission happens in game state
-            # This property will be checked by the game state during drawing
+            # This property will be checked by the game state after the sprite update
             self.emit_particles = True
         else:
             self.emit_particles = False
@@ -283,4 +305,53 @@ class PowerUp(pygame.sprite.Sprite):
             else:
                 print("Warning: health powerup sound not found or loaded.")
         # Common logic for all power-ups after activation (e.g., removal)
-        self.kill() # Remove power-up sprite from all groups 
\ No newline at end of file
+        self.kill() # Remove power-up sprite from all groups 
+
+
+class PowerUpPool:
+    """Recycles PowerUp objects between spawns."""
+
+    def __init__(self, screen_width, screen_height):
+        """Initialize an empty pool.
+
+        Args:
+            screen_width (int): Width of the game screen.
+            screen_height (int): Height of the game screen.
+        """
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self._free = []  # Killed power-ups ready for reuse
+
+    def acquire(self, initial_position, powerup_type_id, powerup_image_surface, amount=None):
+        """Get a freshly initialized power-up.
+
+        Args:
+            initial_position (tuple): The (x, y) coordinates for the power-up.
+            powerup_type_id (str): The identifier for the type of power-up (e.g., "boom").
+            powerup_image_surface (pygame.Surface): The pre-loaded image for this power-up.
+            amount (int): Amount for health power-ups.
+
+        Returns:
+            PowerUp: Recycled when one is available.
+        """
+        if self._free:
+            powerup = self._free.pop()
+            powerup.reinit(initial_position, powerup_type_id, powerup_image_surface, amount)
+            return powerup
+        return PowerUp(
+            initial_position,
+            powerup_type_id,
+            powerup_image_surface,
+            self.screen_width,
+            self.screen_height,
+            amount=amount,
+            pool=self
+        )
+
+    def release(self, powerup):
+        """Return a killed power-up to the pool.
+
+        Args:
+            powerup (PowerUp): Power-up that is no longer in any sprite group.
+        """
+        self._free.append(powerup)
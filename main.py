@@ -4,8 +4,12 @@ Final Escape - Main Game Entry Point
 This file serves as the main entry point for the game and manages the overall game loop
 and state transitions between different game states.
 """
-import pygame
+import logging
+import math
+import random
 import sys
+
+import pygame
 from constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, STATE_MENU, STATE_COUNTDOWN, 
     STATE_PLAYING, STATE_GAME_OVER, STATE_SETTINGS,
@@ -20,6 +24,12 @@ from states.countdown_state import CountdownState
 from states.game_state import GameState
 from states.game_over_state import GameOverState
 
+# Unit direction vectors for the game-start burst, one every 5 degrees
+_START_BURST_DIRS = tuple(
+    (math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+    for angle in range(0, 360, 5)
+)
+
 class Game:
     """Main game manager class that handles state transitions and the game loop."""
     
@@ -111,6 +121,9 @@ class Game:
             dt = self.clock.tick(60) / 1000.0
             if dt > 0.1:  # Prevent large time steps
                 dt = 0.05
+            
+            # Start any music track waiting on a fade-out
+            self.asset_loader.update_music()
                 
             # Handle events
             for event in pygame.event.get():
@@ -267,30 +280,25 @@ class Game:
             (135, 206, 250)   # Light Sky Blue
         ]
         
-        # Emit particles in all directions
-        for angle in range(0, 360, 5):  # Every 5 degrees
-            # Calculate direction
-            import math
-            angle_rad = angle * (math.pi / 180)
-            dir_x = math.cos(angle_rad)
-            dir_y = math.sin(angle_rad)
-            
-            # Calculate velocity
-            import random
+        # Collect particles in all directions, then emit them in a single batch
+        vel_xs = []
+        vel_ys = []
+        for dir_x, dir_y in _START_BURST_DIRS:
+            # Calculate velocity (two particles per direction)
             speed = random.uniform(200, 300)
-            vel_x = dir_x * speed
-            vel_y = dir_y * speed
+            vel_xs.extend([dir_x * speed] * 2)
+            vel_ys.extend([dir_y * speed] * 2)
             
-            # Emit the particle
-            self.particle_system.emit_particles(
-                center_x, center_y,
-                colors,
-                count=2,
-                velocity_range=((vel_x * 0.9, vel_x * 1.1), (vel_y * 0.9, vel_y * 1.1)),
-                size_range=(2, 4),
-                lifetime_range=(0.8, 1.2),
-                fade=True
-            )
+        count = len(vel_xs)
+        self.particle_system.emit_particles_batch(
+            [center_x] * count, [center_y] * count,
+            vel_xs, vel_ys,
+            colors,
+            size_range=(2, 4),
+            lifetime_range=(0.8, 1.2),
+            velocity_jitter=0.1,
+            fade=True
+        )
 
     def toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode."""
@@ -319,5 +327,7 @@ class Game:
 
 
 if __name__ == "__main__":
+    # Keep debug/info chatter off the console during play
+    logging.basicConfig(level=logging.WARNING)
     game = Game()
     game.run() 
\ No newline at end of file
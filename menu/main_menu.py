@@ -4,6 +4,7 @@ Main Menu for Final Escape game.
 import pygame
 from constants import STATE_COUNTDOWN, STATE_SETTINGS, SCREEN_WIDTH, SCREEN_HEIGHT
 from menu.menu_component import Menu
+from engine.utils import convert_text_surface
 from settings.settings_manager import SettingsManager
 
 class MainMenu(Menu):
@@ -22,7 +23,7 @@ class MainMenu(Menu):
         self.screen_height = screen_height if screen_height is not None else SCREEN_HEIGHT
         
         # Get assets to restore the pixel font
-        assets = asset_loader.load_game_assets()
+        assets = asset_loader.get_game_assets()
         
         # Get fonts from the asset loader
         title_font = assets["fonts"]["title"] if "fonts" in assets and "title" in assets["fonts"] else None
@@ -36,6 +37,15 @@ class MainMenu(Menu):
         self.title_border_width = 2
         self.title_color = (255, 255, 255)  # White text
         
+        # Bordered title surfaces keyed by text (the title never changes per frame)
+        self._bordered_title_cache = {}
+        
+        # Transparent stand-in for the base class title and the star-friendly overlay,
+        # built once instead of every frame
+        self._hidden_title_surface = pygame.Surface(self.title_surface.get_size(), pygame.SRCALPHA)
+        self._bg_overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+        self._bg_overlay.fill((0, 0, 30, 20))  # Very transparent background
+        
         # Initialize settings manager to access saved settings
         self.settings_manager = SettingsManager()
         
@@ -92,16 +102,34 @@ class MainMenu(Menu):
             text: Title text
             position: (x, y) position for the title
         """
+        border_surface = self._bordered_title_cache.get(text)
+        if border_surface is None:
+            border_surface = self._create_bordered_title(text)
+            self._bordered_title_cache[text] = border_surface
+        
+        # Draw the combined surface to the main surface
+        border_rect = border_surface.get_rect(center=position)
+        surface.blit(border_surface, border_rect)
+    
+    def _create_bordered_title(self, text):
+        """Build the title text with its border on a single surface.
+        
+        Args:
+            text: Title text
+            
+        Returns:
+            Surface containing the bordered title
+        """
         # Create text surface with the title color
         text_surface = self.title_font.render(text, True, self.title_color)
-        text_rect = text_surface.get_rect(center=position)
         
         # Create a slightly larger surface for the border
         border_surface = pygame.Surface((text_surface.get_width() + self.title_border_width*2, 
                                        text_surface.get_height() + self.title_border_width*2),
                                       pygame.SRCALPHA)
         
-        # Draw the border by rendering the text in the border color at offset positions
+        # Draw the border by blitting the text in the border color at offset positions
+        border_text = self.title_font.render(text, True, self.title_border_color)
         for x_offset in range(-self.title_border_width, self.title_border_width+1):
             for y_offset in range(-self.title_border_width, self.title_border_width+1):
                 # Skip the center position (that will be the main text)
@@ -112,17 +140,13 @@ class MainMenu(Menu):
                 if abs(x_offset) != self.title_border_width and abs(y_offset) != self.title_border_width:
                     continue
                 
-                border_text = self.title_font.render(text, True, self.title_border_color)
                 border_surface.blit(border_text, 
                                   (self.title_border_width + x_offset, 
                                    self.title_border_width + y_offset))
         
         # Draw the main text in the center
         border_surface.blit(text_surface, (self.title_border_width, self.title_border_width))
-        
-        # Draw the combined surface to the main surface
-        border_rect = border_surface.get_rect(center=position)
-        surface.blit(border_surface, border_rect)
+        return convert_text_surface(border_surface)
     
     def draw(self, surface):
         """Draw the menu with custom title rendering but otherwise use the parent class's button animations.
@@ -139,17 +163,13 @@ class MainMenu(Menu):
         original_title_glow_alpha = self.title_glow_alpha
         self.title_glow_alpha = 0  # Disable the glow animation
         
-        # Instead of setting to None, create a transparent surface of the same size
+        # Instead of setting to None, swap in the cached transparent surface of the same size
         if self.title_surface:
-            transparent_surface = pygame.Surface(self.title_surface.get_size(), pygame.SRCALPHA)
-            transparent_surface.fill((0, 0, 0, 0))  # Completely transparent
-            self.title_surface = transparent_surface
+            self.title_surface = self._hidden_title_surface
             
         # Draw only a semi-transparent overlay to allow stars to be visible
         if hasattr(self, 'background_alpha') and self.background_alpha > 0:
-            bg_overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            bg_overlay.fill((0, 0, 30, 20))  # Very transparent background
-            surface.blit(bg_overlay, (0, 0))
+            surface.blit(self._bg_overlay, (0, 0))
         
         # Call parent class draw method to draw everything except the visible title
         # This will handle all the button animations
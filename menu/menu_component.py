@@ -7,6 +7,7 @@ from constants import (
     TITLE_FONT_SIZE, INSTRUCTION_FONT_SIZE, MENU_SELECT_SOUND_PATH,
     MENU_NAVIGATE_SOUND_PATH
 )
+from engine.utils import convert_text_surface, render_cached_text
 
 class MenuItem:
     """A single item/option in a menu."""
@@ -130,7 +131,7 @@ class Menu:
         self.settings_manager = SettingsManager()
         
         # Render the title
-        self.title_surface = self.title_font.render(self.title, True, (255, 255, 255))
+        self.title_surface = convert_text_surface(self.title_font.render(self.title, True, (255, 255, 255)))
         self.title_rect = self.title_surface.get_rect(center=(self.screen_width // 2, 150))
         
         # For title glow effect
@@ -162,7 +163,8 @@ class Menu:
             "Enter: Select",
             "Esc: Back"
         ]
-        self.help_surfaces = [self.help_font.render(text, True, (200, 200, 200)) for text in self.help_text]
+        self.help_surfaces = [convert_text_surface(self.help_font.render(text, True, (200, 200, 200)))
+                              for text in self.help_text]
         
         # Notification system (for confirmations)
         self.notification = None
@@ -172,11 +174,14 @@ class Menu:
         # Menu background effect
         self.background_alpha = 30  # Very subtle background overlay
         
+        # Text surfaces for render_cached_text, keyed by (font id, text, color); alpha is set per blit
+        self._text_cache = {}
+        
     def _load_sounds(self):
         """Load menu sound effects if asset_loader is available."""
         if self.asset_loader:
             try:
-                assets = self.asset_loader.load_game_assets()
+                assets = self.asset_loader.get_game_assets()
                 if "sounds" in assets:
                     self.navigate_sound = assets["sounds"].get("menu_navigate")
                     self.select_sound = assets["sounds"].get("menu_select")
@@ -446,9 +451,8 @@ class Menu:
             surface.blit(glow_surface, glow_rect)
         
         # Draw the title
-        title_surface_with_alpha = self.title_surface.copy()
-        title_surface_with_alpha.set_alpha(alpha)
-        surface.blit(title_surface_with_alpha, self.title_rect)
+        self.title_surface.set_alpha(alpha)
+        surface.blit(self.title_surface, self.title_rect)
         
         # Draw menu items
         if self.items:
@@ -471,7 +475,7 @@ class Menu:
                 
                 # Apply the item's current alpha
                 actual_alpha = min(alpha, item.alpha)
-                text_surface = self.item_font.render(item.text, True, color)
+                text_surface = render_cached_text(self._text_cache, self.item_font, item.text, color)
                 text_surface.set_alpha(actual_alpha)
                 text_rect = text_surface.get_rect(center=(self.screen_width // 2, item_y))
                 
@@ -525,10 +529,9 @@ class Menu:
             help_y = self.screen_height - 20 * len(self.help_surfaces) - 10
             
             for i, help_surface in enumerate(self.help_surfaces):
-                help_surface_copy = help_surface.copy()
-                help_surface_copy.set_alpha(help_alpha)
-                help_rect = help_surface_copy.get_rect(bottomright=(self.screen_width - 20, help_y + i * 20))
-                surface.blit(help_surface_copy, help_rect)
+                help_surface.set_alpha(help_alpha)
+                help_rect = help_surface.get_rect(bottomright=(self.screen_width - 20, help_y + i * 20))
+                surface.blit(help_surface, help_rect)
                 
         # Draw notification if exists
         if self.notification and self.notification_timer > 0:
@@ -541,7 +544,7 @@ class Menu:
                 
             # Create notification text
             notif_alpha = int(200 * fade)
-            notif_surface = self.item_font.render(self.notification, True, (100, 255, 100))
+            notif_surface = render_cached_text(self._text_cache, self.item_font, self.notification, (100, 255, 100))
             notif_surface.set_alpha(notif_alpha)
             
             # Create background
@@ -4,6 +4,7 @@ Settings Menu for Final Escape game.
 import pygame
 from constants import STATE_MENU, DIFFICULTY_LEVELS, SCREEN_WIDTH, SCREEN_HEIGHT
 from menu.menu_component import Menu
+from engine.utils import render_cached_text
 
 class SettingItem:
     """Extended menu item specifically for settings that need left/right adjustment."""
@@ -49,7 +50,7 @@ class SettingsMenu(Menu):
         self.screen_height = screen_height if screen_height is not None else SCREEN_HEIGHT
         
         # Get assets
-        assets = asset_loader.load_game_assets()
+        assets = asset_loader.get_game_assets()
         
         # Get fonts from the asset loader
         title_font = assets["fonts"]["title"] if "fonts" in assets and "title" in assets["fonts"] else None
@@ -145,10 +146,7 @@ class SettingsMenu(Menu):
             self.opacity_item.text = self.setting_items["opacity"].get_display_text()
             
             # Apply setting immediately to star field
-            # Convert percentage to opacity value (0-255)
-            opacity_value = int(new_value * 255 / 100)
-            for star in self.star_field.stars:
-                star.opacity = opacity_value
+            self.star_field.set_opacity(new_value)
             
             # Play navigation sound effect if available
             if self.navigate_sound:
@@ -328,7 +326,7 @@ class SettingsMenu(Menu):
                 
                 # Apply the item's current alpha
                 actual_alpha = min(alpha, item.alpha)
-                text_surface = self.item_font.render(item.text, True, color)
+                text_surface = render_cached_text(self._text_cache, self.item_font, item.text, color)
                 text_surface.set_alpha(actual_alpha)
                 text_rect = text_surface.get_rect(center=(self.screen_width // 2, item_y))
                 
@@ -389,13 +387,12 @@ class SettingsMenu(Menu):
                     
                 # Draw description text with better positioning
                 if setting_item.description:
-                    desc_surface = self.description_font.render(setting_item.description, True, (180, 180, 180))
+                    desc_surface = render_cached_text(self._text_cache, self.description_font, setting_item.description, (180, 180, 180))
                     desc_rect = desc_surface.get_rect(center=(self.screen_width // 2, item_y + 25))
                     
                     # Apply opacity
-                    desc_with_alpha = desc_surface.copy()
-                    desc_with_alpha.set_alpha(alpha)
-                    surface.blit(desc_with_alpha, desc_rect)
+                    desc_surface.set_alpha(alpha)
+                    surface.blit(desc_surface, desc_rect)
                 
                 # Draw adjustment arrows if needed
                 if setting_item.arrows_visible:
@@ -454,10 +451,9 @@ class SettingsMenu(Menu):
             help_y = self.screen_height - 20 * len(self.help_surfaces) - 10
             
             for i, help_surface in enumerate(self.help_surfaces):
-                help_surface_copy = help_surface.copy()
-                help_surface_copy.set_alpha(help_alpha)
-                help_rect = help_surface_copy.get_rect(bottomright=(self.screen_width - 20, help_y + i * 20))
-                surface.blit(help_surface_copy, help_rect)
+                help_surface.set_alpha(help_alpha)
+                help_rect = help_surface.get_rect(bottomright=(self.screen_width - 20, help_y + i * 20))
+                surface.blit(help_surface, help_rect)
                 
         # Draw notification if exists
         if self.notification and self.notification_timer > 0:
@@ -470,7 +466,7 @@ class SettingsMenu(Menu):
                 
             # Create notification text
             notif_alpha = int(200 * fade)
-            notif_surface = self.item_font.render(self.notification, True, (100, 255, 100))
+            notif_surface = render_cached_text(self._text_cache, self.item_font, self.notification, (100, 255, 100))
             notif_surface.set_alpha(notif_alpha)
             
             # Create background
@@ -1,12 +1,16 @@
 """
 Countdown state for Final Escape game.
 """
+import logging
 import pygame
 from constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, BACKGROUND_COLOR, 
-    COUNTDOWN_DURATION, COUNTDOWN_FONT_SIZE, COUNTDOWN_COLOR,
+    COUNTDOWN_DURATION, COUNTDOWN_FONT_SIZE, COUNTDOWN_MIN_FONT_SIZE, COUNTDOWN_COLOR,
     FADE_DURATION, STATE_PLAYING
 )
+from engine.utils import fade_in_alpha, create_fade_surface
+
+logger = logging.getLogger(__name__)
 
 class CountdownState:
     """Countdown before gameplay starts."""
@@ -31,27 +35,59 @@ class CountdownState:
         
         # Setup fonts - try to use custom fonts if asset_loader is provided
         if asset_loader:
-            assets = asset_loader.load_game_assets()
+            assets = asset_loader.get_game_assets()
             self.countdown_font = assets["fonts"]["countdown"] if "fonts" in assets and "countdown" in assets["fonts"] else pygame.font.Font(None, COUNTDOWN_FONT_SIZE)
         else:
             # Fallback to default font
             self.countdown_font = pygame.font.Font(None, COUNTDOWN_FONT_SIZE)
         
+        # Fonts for the scale animation, built the first time each point size is
+        # drawn; only the sizes the animation actually hits are ever created
+        try:
+            # Get the font path from our countdown font
+            self._font_path = self.countdown_font.get_filename() if asset_loader else None
+        except Exception:
+            # Fallback to default font if there's an error
+            self._font_path = None
+        self._scaled_fonts = {}
+        
+        # Rendered number surfaces keyed by (countdown_num, font size)
+        self._number_surfaces = {}
+        
         # Countdown timer
         self.timer = 0
         self.duration = COUNTDOWN_DURATION
+        self._last_second = -1  # Last whole second seen, to detect number changes
         
         # Transition variables
         self.transition_out = False
         self.fade_alpha = 0
         self.transition_timer = 0
         
+        # Fade overlay is allocated once; only its alpha changes per frame
+        self.fade_surface = create_fade_surface(self.screen_width, self.screen_height)
+        
         # Scaling animation for numbers
         self.scale_factor = 0.1  # Start small
         self.target_scale = 1.0  # Target scale
         self.scale_speed = 2.0   # Units per second
         
-        print("CountdownState initialized")
+        logger.debug("CountdownState initialized")
+        
+    def _load_scaled_font(self, font_path, size):
+        """Load the countdown font at the given size.
+        
+        Args:
+            font_path: Path to the font file, or None for the default font
+            size: Font size
+            
+        Returns:
+            pygame.font.Font instance
+        """
+        if self.asset_loader:
+            # The asset loader caches fonts, so later countdowns reuse them
+            return self.asset_loader.load_font(font_path, size)
+        return pygame.font.Font(font_path, size)
         
     def handle_event(self, event):
         """Handle pygame events.
@@ -64,7 +100,7 @@ class CountdownState:
         """
         # Skip button (optional)
         if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-            print("Skip button pressed in countdown - immediate transition to playing")
+            logger.debug("Skip button pressed in countdown - immediate transition to playing")
             self.timer = self.duration
             self.transition_out = True
             self.transition_timer = 0
@@ -94,7 +130,9 @@ class CountdownState:
         countdown_num = max(1, int(self.duration - self.timer) + 1)
         
         # Reset scale animation when number changes
-        if self.timer % 1 < dt:  # Check if we just crossed a whole second
+        new_second = int(self.timer)
+        if new_second != self._last_second:  # Check if we just crossed a whole second
+            self._last_second = new_second
             self.scale_factor = 0.1
             
         # Update scale animation
@@ -105,18 +143,18 @@ class CountdownState:
         
         # Check if countdown is finished
         if self.timer >= self.duration and not self.transition_out:
-            print("Countdown complete - starting transition")
+            logger.debug("Countdown complete - starting transition")
             self.transition_out = True
             self.transition_timer = 0
             
         # Handle transition out if active
         if self.transition_out:
             self.transition_timer += dt
-            self.fade_alpha = min(255, int(255 * (self.transition_timer / FADE_DURATION)))
+            self.fade_alpha = fade_in_alpha(self.transition_timer, FADE_DURATION)
             
             # If transition complete, change to gameplay state
             if self.transition_timer >= FADE_DURATION:
-                print("Countdown transition complete - switching to gameplay")
+                logger.debug("Countdown transition complete - switching to gameplay")
                 return STATE_PLAYING
                 
         return None
@@ -141,33 +179,23 @@ class CountdownState:
             countdown_num = max(1, int(self.duration - self.timer) + 1)
             
             # Create text with current scale
-            base_size = COUNTDOWN_FONT_SIZE
-            scaled_size = int(base_size * self.scale_factor)
-            
-            # Use regular font if scale is too small
-            if scaled_size < 20:
-                scaled_size = 20
-            
-            # Try to use the custom font for scaling if available
-            if self.asset_loader:
-                try:
-                    # Get the font path from our countdown font
-                    font_path = self.countdown_font.get_filename()
-                    scaled_font = pygame.font.Font(font_path, scaled_size)
-                except:
-                    # Fallback to default font if there's an error
-                    scaled_font = pygame.font.Font(None, scaled_size)
-            else:
-                scaled_font = pygame.font.Font(None, scaled_size)
+            scaled_size = int(COUNTDOWN_FONT_SIZE * self.scale_factor)
+            scaled_size = min(COUNTDOWN_FONT_SIZE, max(COUNTDOWN_MIN_FONT_SIZE, scaled_size))
             
-            countdown_text = str(countdown_num)
-            countdown_surface = scaled_font.render(countdown_text, True, COUNTDOWN_COLOR)
+            # Reuse the rendered number if this size was already drawn
+            surface_key = (countdown_num, scaled_size)
+            countdown_surface = self._number_surfaces.get(surface_key)
+            if countdown_surface is None:
+                scaled_font = self._scaled_fonts.get(scaled_size)
+                if scaled_font is None:
+                    scaled_font = self._load_scaled_font(self._font_path, scaled_size)
+                    self._scaled_fonts[scaled_size] = scaled_font
+                countdown_surface = scaled_font.render(str(countdown_num), True, COUNTDOWN_COLOR)
+                self._number_surfaces[surface_key] = countdown_surface
             countdown_rect = countdown_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
             surface.blit(countdown_surface, countdown_rect)
         
         # Draw fade overlay for transition
         if self.transition_out and self.fade_alpha > 0:
-            fade_surface = pygame.Surface((self.screen_width, self.screen_height))
-            fade_surface.fill((0, 0, 0))
-            fade_surface.set_alpha(self.fade_alpha)
-            surface.blit(fade_surface, (0, 0)) 
\ No newline at end of file
+            self.fade_surface.set_alpha(self.fade_alpha)
+            surface.blit(self.fade_surface, (0, 0)) 
\ No newline at end of file
@@ -1,6 +1,7 @@
 """
 Game over state for Final Escape game.
 """
+import logging
 import pygame
 import random
 import time
@@ -10,6 +11,19 @@ from constants import (
     FADE_DURATION, STATE_MENU
 )
 
+from engine.utils import convert_text_surface
+
+logger = logging.getLogger(__name__)
+
+# Event types this screen never reacts to; blocked from the queue while it is shown
+_IGNORED_EVENTS = [
+    pygame.MOUSEMOTION, pygame.JOYAXISMOTION,
+    pygame.JOYHATMOTION, pygame.JOYBALLMOTION
+]
+
+# Event types that count as "any key" to leave the screen
+_ACCEPT_EVENTS = frozenset({pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.JOYBUTTONDOWN})
+
 class GameOverState:
     """The game over state shown when the player dies."""
     
@@ -33,7 +47,7 @@ class GameOverState:
         
         # Setup fonts - try to use custom fonts if asset_loader is provided
         if asset_loader:
-            assets = asset_loader.load_game_assets()
+            assets = asset_loader.get_game_assets()
             self.game_over_font = assets["fonts"]["game_over"] if "fonts" in assets and "game_over" in assets["fonts"] else pygame.font.Font(None, GAME_OVER_FONT_SIZE)
             self.instruction_font = assets["fonts"]["instruction"] if "fonts" in assets and "instruction" in assets["fonts"] else pygame.font.Font(None, INSTRUCTION_FONT_SIZE)
         else:
@@ -41,8 +55,18 @@ class GameOverState:
             self.game_over_font = pygame.font.Font(None, GAME_OVER_FONT_SIZE)
             self.instruction_font = pygame.font.Font(None, INSTRUCTION_FONT_SIZE)
         
+        # Pre-render the static texts once; draw() only blits them
+        center_x = self.screen_width // 2
+        self._game_over_surface = convert_text_surface(self.game_over_font.render("GAME OVER", True, (255, 255, 255)))
+        self._game_over_rect = self._game_over_surface.get_rect(center=(center_x, self.screen_height // 3))
+        # Pulsing is done with set_alpha on this surface, so it needs no per-frame copy
+        self._instruction_surface = convert_text_surface(
+            self.instruction_font.render("Press any key to return to menu", True, (255, 255, 255)))
+        self._instruction_rect = self._instruction_surface.get_rect(center=(center_x, self.screen_height * 3 // 4))
+        
         # Store final score
         self.final_score = 0
+        self._render_score()
         
         # Simple delay to prevent accidental key presses
         self.allow_transition = False
@@ -54,10 +78,11 @@ class GameOverState:
         
         # Instruction text animation
         self.instruction_alpha = 255
-        self.fade_direction = -1  # -1 for fade out, 1 for fade in
+        self.min_instruction_alpha = 100
         self.fade_speed = 200  # Alpha change per second
+        self._fade_phase = 0.0  # Position in the pulse cycle (0-1), 0 = fully visible
         
-        print("GameOverState initialized")
+        logger.debug("GameOverState initialized")
         
     def set_score(self, score):
         """Set the final score to display.
@@ -66,10 +91,31 @@ class GameOverState:
             score: The final score value
         """
         self.final_score = score
+        self._render_score()
         self.allow_transition = False
         self.delay_timer = 0
         self.transition_requested = False
-        print(f"Final score set: {score}")
+        
+        # Entering the game over screen - stop motion events flooding the queue
+        # and drop any that were queued before the block took effect
+        pygame.event.set_blocked(_IGNORED_EVENTS)
+        pygame.event.clear(_IGNORED_EVENTS)
+        logger.debug("Final score set: %s", score)
+        
+    def _render_score(self):
+        """Render the score text for the current final score."""
+        score_text = f"Score: {int(self.final_score)}"
+        self._score_surface = convert_text_surface(self.game_over_font.render(score_text, True, SCORE_COLOR))
+        self._score_rect = self._score_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
+        
+    def _leave(self):
+        """Restore the event types blocked while the game over screen is shown.
+        
+        Returns:
+            STATE_MENU
+        """
+        pygame.event.set_allowed(_IGNORED_EVENTS)
+        return STATE_MENU
         
     def handle_event(self, event):
         """Handle pygame events.
@@ -85,12 +131,10 @@ class GameOverState:
             return None
             
         # Check for any input 
-        if (event.type == pygame.KEYDOWN or 
-            event.type == pygame.MOUSEBUTTONDOWN or
-            event.type == pygame.JOYBUTTONDOWN):
-            print("Input detected in game over state - transitioning to menu")
+        if event.type in _ACCEPT_EVENTS:
+            logger.debug("Input detected in game over state - transitioning to menu")
             self.transition_requested = True
-            return STATE_MENU
+            return self._leave()
             
         return None
                 
@@ -108,7 +152,7 @@ class GameOverState:
             self.delay_timer += dt
             if self.delay_timer >= self.delay_threshold:
                 self.allow_transition = True
-                print("Game over state ready for transition")
+                logger.debug("Game over state ready for transition")
         
         # Update stars
         self.star_field.update(dt)
@@ -116,20 +160,16 @@ class GameOverState:
         # Update particles
         self.particle_system.update(dt)
         
-        # Update instruction text animation
-        self.instruction_alpha += self.fade_direction * self.fade_speed * dt
-        if self.instruction_alpha <= 100:
-            self.instruction_alpha = 100
-            self.fade_direction = 1
-        elif self.instruction_alpha >= 255:
-            self.instruction_alpha = 255
-            self.fade_direction = -1
+        # Update instruction text animation (triangle wave between min alpha and 255)
+        alpha_span = 255 - self.min_instruction_alpha
+        self._fade_phase = (self._fade_phase + dt * self.fade_speed / (2 * alpha_span)) % 1.0
+        self.instruction_alpha = self.min_instruction_alpha + alpha_span * abs(2 * self._fade_phase - 1)
         
         # Check if transition was requested via event
         if self.transition_requested:
-            print("Transition requested - returning to menu from game over state")
+            logger.debug("Transition requested - returning to menu from game over state")
             self.transition_requested = False  # Reset flag to prevent multiple transitions
-            return STATE_MENU
+            return self._leave()
         
         return None
             
@@ -148,27 +188,12 @@ class GameOverState:
         # Draw particles
         self.particle_system.draw(surface)
         
-        # Draw game over text
-        game_over_text = "GAME OVER"
-        game_over_surface = self.game_over_font.render(game_over_text, True, (255, 255, 255))
-        game_over_rect = game_over_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 3))
-        surface.blit(game_over_surface, game_over_rect)
+        # Instruction text pulses via its surface alpha
+        self._instruction_surface.set_alpha(int(self.instruction_alpha))
         
-        # Draw score
-        score_text = f"Score: {int(self.final_score)}"
-        score_surface = self.game_over_font.render(score_text, True, SCORE_COLOR)
-        score_rect = score_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-        surface.blit(score_surface, score_rect)
-        
-        # Draw instruction text with pulsing effect
-        instruction_text = "Press any key to return to menu"
-        instruction_surface = self.instruction_font.render(instruction_text, True, (255, 255, 255))
-        instruction_rect = instruction_surface.get_rect(center=(self.screen_width // 2, self.screen_height * 3 // 4))
-        
-        # Create a surface with alpha for the pulsing effect
-        alpha_surface = pygame.Surface(instruction_surface.get_size(), pygame.SRCALPHA)
-        alpha_surface.fill((255, 255, 255, 0))
-        alpha_surface.blit(instruction_surface, (0, 0))
-        alpha_surface.set_alpha(int(self.instruction_alpha))
-        
-        surface.blit(alpha_surface, instruction_rect) 
\ No newline at end of file
+        # Draw game over text, score and instruction in one batched call
+        surface.blits((
+            (self._game_over_surface, self._game_over_rect),
+            (self._score_surface, self._score_rect),
+            (self._instruction_surface, self._instruction_rect)
+        ), doreturn=False) 
\ No newline at end of file
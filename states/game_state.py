@@ -1,15 +1,19 @@
 """
 Game state for Asteroid Navigator game.
 """
+import logging
 import pygame
 import random
 import math
+import heapq
+from itertools import accumulate, count
 from pygame.math import Vector2
 from constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, BACKGROUND_COLOR,
     SCORE_FONT_SIZE, SCORE_COLOR, ASTEROID_SPAWN_RATE,
     HEALTH_BAR_WIDTH, HEALTH_BAR_HEIGHT, HEALTH_BAR_BORDER,
     HEALTH_BAR_COLOR, HEALTH_BAR_BACKGROUND_COLOR, HEALTH_BAR_BORDER_COLOR,
+    HEALTH_TEXT_CACHE_SIZE,
     PLAYER_MAX_HEALTH, FADE_DURATION, STATE_GAME_OVER,
     DIFFICULTY_SPAWN_RATE_MULTIPLIERS, DIFFICULTY_ASTEROID_VARIETY,
     DIFFICULTY_SIZE_RESTRICTIONS, INSTRUCTION_FONT_SIZE,
@@ -25,9 +29,60 @@ from constants import (
     DIFFICULTY_POWERUP_SPAWN_MULTIPLIERS # <-- Add this import
 )
 from entities.player import Player
-from entities.asteroid import Asteroid
-from entities.powerup import PowerUp, PowerUpGroup # Import the new PowerUpGroup
+from entities.asteroid import AsteroidPool
+from entities.powerup import PowerUpGroup, PowerUpPool # Import the new PowerUpGroup
 from settings.settings_manager import SettingsManager
+from engine.utils import (
+    fade_in_alpha, create_fade_surface, convert_text_surface, convert_opaque_surface,
+    render_cached_text
+)
+
+logger = logging.getLogger(__name__)
+
+# Difficulty HUD colors, from green (easiest) to red (hardest)
+_DIFFICULTY_COLORS = {
+    "Empty Space": (0, 255, 0),  # Green for easiest
+    "Normal Space": (255, 255, 0),  # Yellow for normal
+    "We did not agree on that": (255, 165, 0),  # Orange for medium
+    "You kidding": (255, 100, 0),  # Dark orange for hard
+    "Hell No!!!": (255, 0, 0)  # Red for hardest
+}
+
+# Subtitle shown under the difficulty notification
+_DIFFICULTY_DESCRIPTIONS = {
+    "Empty Space": "Relaxed navigation mode",
+    "Normal Space": "Standard asteroid density",
+    "We did not agree on that": "Increased hazards ahead!",
+    "You kidding": "Seriously dangerous conditions!",
+    "Hell No!!!": "Virtually unsurvivable!"
+}
+
+# Unit direction vectors for the difficulty starburst, one every 10 degrees
+_BURST_DIRS = tuple(
+    (math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+    for angle in range(0, 360, 10)
+)
+
+# Asteroid type sampling tables per difficulty: (type_ids, cumulative_weights)
+_ASTEROID_TYPE_TABLES = {
+    difficulty: (tuple(weights), tuple(accumulate(weights.values())))
+    for difficulty, weights in DIFFICULTY_ASTEROID_VARIETY.items()
+}
+
+def _circles_overlap(sprite_a, sprite_b):
+    """Circle collision test on the sprites' radius attributes, without a square root.
+    
+    Args:
+        sprite_a: Sprite with rect and radius
+        sprite_b: Sprite with rect and radius
+        
+    Returns:
+        bool: True if the circles overlap
+    """
+    dx = sprite_a.rect.centerx - sprite_b.rect.centerx
+    dy = sprite_a.rect.centery - sprite_b.rect.centery
+    reach = sprite_a.radius + sprite_b.radius
+    return dx * dx + dy * dy <= reach * reach
 
 class GameState:
     """The main gameplay state."""
@@ -53,15 +108,61 @@ class GameState:
         # Load settings
         self.settings_manager = SettingsManager()
         
+        # Difficulty only changes between games; read it once here and in reset()
+        self._current_difficulty = self.settings_manager.get_difficulty()
+        
+        # Difficulty label text, color and subtitle, looked up once per difficulty change
+        self._set_difficulty_display(self._current_difficulty)
+        
         # Setup fonts
         self.score_font = pygame.font.Font(None, SCORE_FONT_SIZE)
         self.message_font = pygame.font.Font(None, INSTRUCTION_FONT_SIZE)
         
+        # Text surfaces for render_cached_text, keyed by (font id, text, color); cleared on reset
+        self._text_cache = {}
+        
+        # Black backing surfaces for text, keyed by (width, height); alpha is set per blit
+        self._text_bg_cache = {}
+        
+        # Score text is re-rendered only when its integer value changes
+        self._last_score_int = -1
+        self._score_surface = None
+        
+        # Rendered health text surfaces keyed by (current_health, max_health)
+        self._health_text_cache = {}
+        
+        # Static parts of the health bar (background + border), composed once
+        self._health_bar_static = self._create_health_bar_static()
+        
+        # Health bar placement never changes; only the fill width does
+        health_bar_x = 10
+        health_bar_y = self.screen_height - HEALTH_BAR_HEIGHT - 10
+        self._health_bar_static_pos = (health_bar_x - HEALTH_BAR_BORDER, health_bar_y - HEALTH_BAR_BORDER)
+        self._health_fill_rect = pygame.Rect(health_bar_x, health_bar_y, 0, HEALTH_BAR_HEIGHT)
+        self._health_text_anchor = (health_bar_x + 10, health_bar_y + HEALTH_BAR_HEIGHT // 2)
+        
+        # Fade overlay for the transition to game over (alpha set per frame)
+        self.fade_surface = create_fade_surface(self.screen_width, self.screen_height)
+        
+        # Boom power-up reach depends only on the screen size
+        self._explosion_radius = min(self.screen_width, self.screen_height) * POWERUP_BOOM_EFFECT_RADIUS_FACTOR
+        
+        # Boom flash overlay, filled once (alpha set per frame)
+        self.flash_surface = create_fade_surface(self.screen_width, self.screen_height, POWERUP_BOOM_FLASH_COLOR)
+        
         # Create sprite groups
         self.all_sprites = pygame.sprite.Group()
+        self.non_powerup_sprites = pygame.sprite.Group() # Player and asteroids (powerups draw themselves)
         self.asteroids = pygame.sprite.Group()
         self.powerups = PowerUpGroup() # Use our custom PowerUpGroup instead of pygame.sprite.Group
         
+        # Bound once; the group is emptied on reset, never replaced
+        self._update_sprites = self.all_sprites.update
+        
+        # Killed asteroids are recycled instead of constructing new ones per spawn
+        self.asteroid_pool = AsteroidPool(particle_system, asset_loader, self.screen_width, self.screen_height)
+        self.powerup_pool = PowerUpPool(self.screen_width, self.screen_height)
+        
         # Create player
         # Ensure assets are loaded before creating the player if not already
         if self.asset_loader.assets is None:
@@ -72,10 +173,13 @@ class GameState:
             particle_system
         )
         self.all_sprites.add(self.player)
+        self.non_powerup_sprites.add(self.player)
         
         # Game variables
         self.score = 0
+        self._update_score_surface()
         self.asteroid_spawn_timer = 0
+        self._base_spawn_interval = self._compute_base_spawn_interval(self._current_difficulty)
         self.next_spawn_interval = self._get_spawn_interval()
         
         # Transition variables
@@ -97,7 +201,9 @@ class GameState:
         self.boom_effect_active = False
         self.boom_flash_timer = 0.0
         self.boom_center = None
-        self.scheduled_sounds = [] # List of (sound_asset, delay_timer)
+        self.scheduled_sounds = [] # Min-heap of (play_time, sequence, sound_asset)
+        self._sound_clock = 0.0 # Game time used for play_time
+        self._sound_sequence = count() # Tie-breaker so sounds never get compared
         
         # Independent power-up spawn timer
         self.powerup_spawn_timer = 0.0
@@ -116,15 +222,30 @@ class GameState:
         
         # Update the instance variable
         self.difficulty = current_difficulty
+        self._current_difficulty = current_difficulty
+        self._set_difficulty_display(current_difficulty)
         
         # Determine if the difficulty changed
         difficulty_changed = current_difficulty != previous_difficulty
         
         # Log for debugging
-        print(f"Game reset: Difficulty is now {current_difficulty} (was {previous_difficulty})")
+        logger.debug("Game reset: Difficulty is now %s (was %s)", current_difficulty, previous_difficulty)
+        
+        # Return live asteroids and power-ups to their pools before clearing the groups
+        for asteroid in self.asteroids.sprites():
+            asteroid.kill()
+        for powerup in self.powerups.sprites():
+            powerup.kill()
+        if difficulty_changed:
+            # Processed asteroid images depend on difficulty
+            self.asteroid_pool.clear_images()
+        
+        # Drop cached text so the cache only holds the current game's strings
+        self._text_cache.clear()
         
         # Clear sprite groups
         self.all_sprites.empty()
+        self.non_powerup_sprites.empty()
         self.asteroids.empty()
         self.powerups.empty() # Clear power-ups on reset
         
@@ -138,10 +259,13 @@ class GameState:
             self.particle_system # Pass the particle_system from GameState
         )
         self.all_sprites.add(self.player)
+        self.non_powerup_sprites.add(self.player)
         
         # Reset game variables
         self.score = 0
+        self._update_score_surface()
         self.asteroid_spawn_timer = 0
+        self._base_spawn_interval = self._compute_base_spawn_interval(current_difficulty)
         self.next_spawn_interval = self._get_spawn_interval()
         
         # Reset transition variables
@@ -162,48 +286,54 @@ class GameState:
         self.boom_flash_timer = 0.0
         self.boom_center = None
         self.scheduled_sounds = []
+        self._sound_clock = 0.0
         
         # Create difficulty notification particles if difficulty changed
         if difficulty_changed:
-            # Get difficulty-specific color
-            difficulty_colors = {
-                "Empty Space": (0, 255, 0),  # Green for easiest
-                "Normal Space": (255, 255, 0),  # Yellow for normal
-                "We did not agree on that": (255, 165, 0),  # Orange for medium
-                "You kidding": (255, 100, 0),  # Dark orange for hard
-                "Hell No!!!": (255, 0, 0)  # Red for hardest
-            }
-            color = difficulty_colors.get(self.difficulty, (255, 255, 255))
+            # Get difficulty-specific color (looked up by _set_difficulty_display above)
+            color = self._difficulty_color
             
             # Create particle burst in the center of the screen
             if self.particle_system:
                 center_x = self.screen_width // 2
                 center_y = self.screen_height // 2
                 
-                # Create a starburst of particles
-                for angle in range(0, 360, 10):
-                    # Convert angle to radians
-                    angle_rad = angle * (3.14159 / 180)
-                    
-                    # Calculate direction
-                    dir_x = math.cos(angle_rad)
-                    dir_y = math.sin(angle_rad)
-                    
-                    # Create velocity based on direction
-                    speed = random.uniform(100, 150)
-                    vel_x = dir_x * speed
-                    vel_y = dir_y * speed
-                    
-                    # Create a particle
-                    self.particle_system.emit_particles(
-                        center_x, center_y,
-                        [color],
-                        count=1,
-                        velocity_range=((vel_x*0.9, vel_x*1.1), (vel_y*0.9, vel_y*1.1)),
-                        size_range=(3, 5),
-                        lifetime_range=(1.0, 1.5),
-                        fade=True
-                    )
+                # Create a starburst of particles, one per direction, in a single batch
+                speeds = [random.uniform(100, 150) for _ in _BURST_DIRS]
+                burst_count = len(_BURST_DIRS)
+                self.particle_system.emit_particles_batch(
+                    [center_x] * burst_count, [center_y] * burst_count,
+                    [dir_x * speed for (dir_x, _), speed in zip(_BURST_DIRS, speeds)],
+                    [dir_y * speed for (_, dir_y), speed in zip(_BURST_DIRS, speeds)],
+                    [color],
+                    size_range=(3, 5),
+                    lifetime_range=(1.0, 1.5),
+                    velocity_jitter=0.1,
+                    fade=True
+                )
+    
+    def _set_difficulty_display(self, difficulty):
+        """Look up the HUD text, color and subtitle for a difficulty.
+        
+        Args:
+            difficulty: Difficulty level name
+        """
+        self._difficulty_text = f"Difficulty: {difficulty}"
+        self._difficulty_color = _DIFFICULTY_COLORS.get(difficulty, SCORE_COLOR)
+        self._difficulty_description = _DIFFICULTY_DESCRIPTIONS.get(difficulty, "")
+    
+    @staticmethod
+    def _compute_base_spawn_interval(difficulty):
+        """Calculate the mean asteroid spawn interval for a difficulty.
+        
+        Args:
+            difficulty: Difficulty level name
+            
+        Returns:
+            float: Base spawn interval in seconds
+        """
+        spawn_rate_multiplier = DIFFICULTY_SPAWN_RATE_MULTIPLIERS.get(difficulty, 1.0)
+        return ASTEROID_SPAWN_RATE / spawn_rate_multiplier
     
     def _get_spawn_interval(self):
         """Calculate spawn interval based on difficulty.
@@ -211,16 +341,12 @@ class GameState:
         Returns:
             float: Spawn interval in seconds
         """
-        # Always get the latest difficulty setting
-        current_difficulty = self.settings_manager.get_difficulty()
-        spawn_rate_multiplier = DIFFICULTY_SPAWN_RATE_MULTIPLIERS.get(current_difficulty, 1.0)
-        base_interval = ASTEROID_SPAWN_RATE / spawn_rate_multiplier
-        return random.uniform(base_interval * 0.8, base_interval * 1.2)
+        # Base interval is computed once per game; jitter it by +/-20%
+        return self._base_spawn_interval * (0.8 + 0.4 * random.random())
     
     def _get_next_powerup_spawn_interval(self):
         """Calculate the next interval for an independent power-up spawn attempt, factoring in difficulty."""
-        current_difficulty = self.settings_manager.get_difficulty()
-        multiplier = DIFFICULTY_POWERUP_SPAWN_MULTIPLIERS.get(current_difficulty, 1.0)
+        multiplier = DIFFICULTY_POWERUP_SPAWN_MULTIPLIERS.get(self._current_difficulty, 1.0)
         base_min = POWERUP_SPAWN_INTERVAL_MIN
         base_max = POWERUP_SPAWN_INTERVAL_MAX
         # Divide by multiplier: higher difficulty = shorter interval = more frequent spawns
@@ -232,18 +358,15 @@ class GameState:
         Returns:
             tuple: (type_id, size_category)
         """
-        # Always get the latest difficulty setting
-        current_difficulty = self.settings_manager.get_difficulty()
-        # Get the weights for the current difficulty
-        weights = DIFFICULTY_ASTEROID_VARIETY.get(current_difficulty, DIFFICULTY_ASTEROID_VARIETY["Normal Space"])
-        
-        # Create a list of types with their weights
-        weighted_types = []
-        for type_id, weight in weights.items():
-            weighted_types.extend([type_id] * weight)
+        # Difficulty cached for this game (refreshed in reset)
+        current_difficulty = self._current_difficulty
+        # Get the precomputed sampling table for the current difficulty
+        type_ids, cumulative_weights = _ASTEROID_TYPE_TABLES.get(
+            current_difficulty, _ASTEROID_TYPE_TABLES["Normal Space"]
+        )
         
-        # Choose a random type from the weighted list
-        type_id = random.choice(weighted_types)
+        # Choose a type from the cumulative weights (zero-weight types are never picked)
+        type_id = random.choices(type_ids, cum_weights=cumulative_weights)[0]
         
         # Choose a size based on the allowed sizes for this type and difficulty
         allowed_sizes = DIFFICULTY_SIZE_RESTRICTIONS.get(
@@ -279,7 +402,7 @@ class GameState:
         # Skip updates if transitioning out
         if self.transition_out:
             self.transition_timer += dt
-            self.fade_alpha = min(255, int(255 * (self.transition_timer / FADE_DURATION)))
+            self.fade_alpha = fade_in_alpha(self.transition_timer, FADE_DURATION)
             
             if self.transition_timer >= FADE_DURATION:
                 return STATE_GAME_OVER
@@ -289,52 +412,63 @@ class GameState:
         if self.boom_effect_active:
             # This flag is set by PowerUp.activate(), effect processing starts here
             if self.boom_center: # Ensure boom_center was set
-                explosion_radius = min(self.screen_width, self.screen_height) * POWERUP_BOOM_EFFECT_RADIUS_FACTOR
+                explosion_radius = self._explosion_radius
                 asteroids_destroyed_count = 0
+                center_x, center_y = self.boom_center
+                
+                # Explosion particles for every destroyed asteroid, emitted in one batch
+                burst_xs, burst_ys, burst_vxs, burst_vys = [], [], [], []
+                uniform = random.uniform
                 
                 for asteroid in list(self.asteroids): # Iterate over a copy for safe removal
-                    distance = self.boom_center.distance_to(asteroid.position)
-                    if distance < explosion_radius + asteroid.radius: # Consider asteroid's own radius
-                        # Create particle explosion for this asteroid
-                        if self.particle_system:
-                            self.particle_system.emit_particles(
-                                asteroid.rect.centerx, asteroid.rect.centery,
-                                ASTEROID_PARTICLE_COLORS, # Use imported constant
-                                count=random.randint(15, 25), # More particles for explosion
-                                velocity_range=((-200, 200), (-200, 200)), # Wider spread
-                                size_range=(2, 5),
-                                lifetime_range=(0.5, 1.0),
-                                fade=True
-                            )
+                    # Compare squared distances to skip the square root
+                    dx = asteroid.position.x - center_x
+                    dy = asteroid.position.y - center_y
+                    reach = explosion_radius + asteroid.radius # Consider asteroid's own radius
+                    if dx * dx + dy * dy < reach * reach:
+                        # Queue a particle explosion for this asteroid
+                        burst_count = random.randint(15, 25) # More particles for explosion
+                        burst_xs.extend([asteroid.rect.centerx] * burst_count)
+                        burst_ys.extend([asteroid.rect.centery] * burst_count)
+                        burst_vxs.extend([uniform(-200, 200) for _ in range(burst_count)]) # Wider spread
+                        burst_vys.extend([uniform(-200, 200) for _ in range(burst_count)])
                         asteroid.kill() # Remove asteroid
                         asteroids_destroyed_count += 1
                         # self.score += 50 # REMOVE: No bonus score for boom effect
 
+                if burst_xs and self.particle_system:
+                    self.particle_system.emit_particles_batch(
+                        burst_xs, burst_ys, burst_vxs, burst_vys,
+                        ASTEROID_PARTICLE_COLORS, # Use imported constant
+                        size_range=(2, 5),
+                        lifetime_range=(0.5, 1.0),
+                        fade=True
+                    )
+
                 # Schedule chained/delayed explosion sounds
                 num_sounds_to_play = min(asteroids_destroyed_count, POWERUP_BOOM_CHAIN_EXPLOSIONS)
                 sound_asset = self.asset_loader.assets["sounds"].get("asteroid_explode")
                 if sound_asset:
                     for i in range(num_sounds_to_play):
-                        self.scheduled_sounds.append((sound_asset, i * POWERUP_BOOM_CHAIN_DELAY))
+                        heapq.heappush(self.scheduled_sounds, (
+                            self._sound_clock + i * POWERUP_BOOM_CHAIN_DELAY,
+                            next(self._sound_sequence),
+                            sound_asset
+                        ))
                 
                 self.boom_center = None # Consume the boom center, effect applied
             self.boom_effect_active = False # Reset active flag, flash timer will handle visuals
 
-        # Process scheduled sounds
-        if self.scheduled_sounds:
-            for i in range(len(self.scheduled_sounds) - 1, -1, -1): # Iterate backwards for safe removal
-                sound_asset, delay = self.scheduled_sounds[i]
-                delay -= dt
-                if delay <= 0:
-                    sound_asset.play()
-                    self.scheduled_sounds.pop(i)
-                else:
-                    self.scheduled_sounds[i] = (sound_asset, delay)
+        # Process scheduled sounds (earliest first; nothing is rewritten while waiting)
+        self._sound_clock += dt
+        scheduled_sounds = self.scheduled_sounds
+        while scheduled_sounds and scheduled_sounds[0][0] <= self._sound_clock:
+            heapq.heappop(scheduled_sounds)[2].play()
 
         # Update flash timer (even if effect_active was reset, flash continues)
         if self.boom_flash_timer > 0:
             self.boom_flash_timer -= dt
-            if self.boom_flash_timer < 0:
+            if self.boom_flash_timer <= 0:
                 self.boom_flash_timer = 0
         
         # Update stars
@@ -344,27 +478,37 @@ class GameState:
         self.particle_system.update(dt)
         
         # Update all sprites
-        self.all_sprites.update(dt, self.joystick)
+        self._update_sprites(dt, self.joystick)
+        
+        # Emit sparkles for powerups whose particle timer fired this update
+        for powerup in self.powerups:
+            if hasattr(powerup, 'emit_particles') and powerup.emit_particles:
+                powerup.emit_particles = False  # Reset the flag
+                self.particle_system.emit_particles(
+                    powerup.position.x, powerup.position.y,
+                    powerup.particle_colors,
+                    count=5,
+                    velocity_range=((-40, 40), (-40, 40)),
+                    size_range=(1, 2),
+                    lifetime_range=(0.3, 0.6),
+                    fade=True
+                )
         
         # Asteroid spawning
         self.asteroid_spawn_timer += dt
         if self.asteroid_spawn_timer >= self.next_spawn_interval:
             self.asteroid_spawn_timer = 0
             self.next_spawn_interval = self._get_spawn_interval()
-            current_difficulty = self.settings_manager.get_difficulty()
 
             # Spawn an asteroid (power-up spawning is now separate)
             type_id, size_category = self._choose_asteroid_type()
-            new_asteroid = Asteroid(
-                self.particle_system, 
-                self.asset_loader,
+            new_asteroid = self.asteroid_pool.acquire(
                 type_id=type_id,
                 size_category=size_category,
-                difficulty=current_difficulty,
-                screen_width=self.screen_width,
-                screen_height=self.screen_height
+                difficulty=self._current_difficulty
             )
             self.all_sprites.add(new_asteroid)
+            self.non_powerup_sprites.add(new_asteroid)
             self.asteroids.add(new_asteroid)
 
         # Independent Power-up spawning
@@ -375,24 +519,25 @@ class GameState:
             if len(self.powerups) < MAX_ACTIVE_POWERUPS:
                 self.spawn_powerup() 
             else:
-                print(f"Max active powerups ({MAX_ACTIVE_POWERUPS}) reached. Skipping spawn.")
+                logger.debug("Max active powerups (%d) reached. Skipping spawn.", MAX_ACTIVE_POWERUPS)
 
-        # Collision detection for asteroids
-        asteroid_hits = pygame.sprite.spritecollide(self.player, self.asteroids, False, pygame.sprite.collide_circle)
-        for asteroid in asteroid_hits:
-            if not self.player.invulnerable:
-                damage_applied = self.player.take_damage(asteroid.damage)
-                if damage_applied:
-                    if self.player.health <= 0:
-                        self.transition_out = True
-                        self.transition_timer = 0
-                        break
+        # Collision detection for asteroids (hits can't do damage while invulnerable)
+        if not self.player.invulnerable:
+            for asteroid in self._asteroids_hitting_player():
+                if not self.player.invulnerable:
+                    damage_applied = self.player.take_damage(asteroid.damage)
+                    if damage_applied:
+                        if self.player.health <= 0:
+                            self.transition_out = True
+                            self.transition_timer = 0
+                            break
         
         # Use our new check_powerup_collisions method
         self.check_powerup_collisions()
         
         # Update score based on time survived
         self.score += dt * 10
+        self._update_score_surface()
         
         # Update difficulty message timer
         if self.show_difficulty_message:
@@ -401,124 +546,63 @@ class GameState:
                 self.show_difficulty_message = False
         
         return None
-            
+    
+    def _asteroids_hitting_player(self):
+        """Find asteroids whose collision circle overlaps the player's.
+        
+        Same test as pygame.sprite.collide_circle on the sprites' radius
+        attributes. Both sprites' circles fit inside their rects, so the
+        rect overlap test (colliderect, done in C) rejects most asteroids
+        before _circles_overlap runs on the rest.
+        
+        Returns:
+            List of colliding asteroid sprites
+        """
+        player = self.player
+        return [asteroid for asteroid in pygame.sprite.spritecollide(player, self.asteroids, False)
+                if _circles_overlap(player, asteroid)]
+        
     def draw(self, surface):
-        """Draw the game state.
+        """Draw the game state along with any active overlays.
         
         Args:
             surface: Pygame surface to draw on
         """
-        # Clear screen
-        surface.fill(BACKGROUND_COLOR)
-        
-        # Draw stars
-        self.star_field.draw(surface)
-        
-        # Draw particles
-        self.particle_system.draw(surface)
-        
-        # Check for powerups that need to emit particles
-        for powerup in self.powerups:
-            if hasattr(powerup, 'emit_particles') and powerup.emit_particles:
-                powerup.emit_particles = False  # Reset the flag
-                self.particle_system.emit_particles(
-                    powerup.position.x, powerup.position.y,
-                    powerup.particle_colors,
-                    count=5,
-                    velocity_range=((-40, 40), (-40, 40)),
-                    size_range=(1, 2),
-                    lifetime_range=(0.3, 0.6),
-                    fade=True
-                )
-        
-        # Draw all sprites except powerups
-        sprites_without_powerups = [sprite for sprite in self.all_sprites.sprites() 
-                                  if sprite not in self.powerups.sprites()]
-        for sprite in sprites_without_powerups:
-            surface.blit(sprite.image, sprite.rect)
-            
-        # Draw powerups with custom drawing
-        self.powerups.draw(surface)
-        
-        # Draw score
-        score_text = f"Score: {int(self.score)}"
-        score_surface = self.score_font.render(score_text, True, SCORE_COLOR)
-        surface.blit(score_surface, (10, 10))
-        
-        # Get current difficulty
-        current_difficulty = self.settings_manager.get_difficulty()
-        
-        # Draw difficulty with color coding
-        difficulty_colors = {
-            "Empty Space": (0, 255, 0),  # Green for easiest
-            "Normal Space": (255, 255, 0),  # Yellow for normal
-            "We did not agree on that": (255, 165, 0),  # Orange for medium
-            "You kidding": (255, 100, 0),  # Dark orange for hard
-            "Hell No!!!": (255, 0, 0)  # Red for hardest
-        }
-        difficulty_color = difficulty_colors.get(current_difficulty, SCORE_COLOR)
-        
-        difficulty_text = f"Difficulty: {current_difficulty}"
-        difficulty_surface = self.score_font.render(difficulty_text, True, difficulty_color)
-        difficulty_rect = difficulty_surface.get_rect(topright=(self.screen_width - 10, 10))
-        
-        # Add a subtle background for better visibility
-        bg_rect = difficulty_rect.inflate(20, 10)
-        bg_rect.topright = (self.screen_width - 5, 5)
-        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        bg_surface.fill((0, 0, 0, 128))  # Semi-transparent black
-        surface.blit(bg_surface, bg_rect)
+        # Most frames show no difficulty message, boom flash or fade
+        if not (self.show_difficulty_message or self.transition_out or self.boom_flash_timer > 0):
+            self._draw_scene(surface)
+            return
         
-        # Draw the difficulty text
-        surface.blit(difficulty_surface, difficulty_rect)
-        
-        # Draw health bar
-        self.draw_health_bar(surface)
+        self._draw_scene(surface)
         
         # Draw fade overlay for transition
         if self.transition_out and self.fade_alpha > 0:
-            fade_surface = pygame.Surface((self.screen_width, self.screen_height))
-            fade_surface.fill((0, 0, 0))
-            fade_surface.set_alpha(self.fade_alpha)
-            surface.blit(fade_surface, (0, 0))
+            self.fade_surface.set_alpha(self.fade_alpha)
+            surface.blit(self.fade_surface, (0, 0))
             
         # Draw boom flash effect if active
         if self.boom_flash_timer > 0:
             flash_alpha = 255 * (self.boom_flash_timer / POWERUP_BOOM_FLASH_DURATION)
             flash_alpha = min(255, max(0, int(flash_alpha))) # Clamp between 0-255
             
-            flash_surface = pygame.Surface((self.screen_width, self.screen_height))
-            flash_surface.fill(POWERUP_BOOM_FLASH_COLOR)
-            flash_surface.set_alpha(flash_alpha)
-            surface.blit(flash_surface, (0,0))
+            self.flash_surface.set_alpha(flash_alpha)
+            surface.blit(self.flash_surface, (0,0))
 
         # Draw difficulty notification
         if self.show_difficulty_message:
             # Calculate alpha (fade out towards the end)
             alpha = min(255, int(255 * (self.difficulty_message_timer / 0.5))) if self.difficulty_message_timer < 0.5 else 255
             
-            # Get current difficulty
-            current_difficulty = self.settings_manager.get_difficulty()
-            
             # Difficulty-specific color
-            difficulty_colors = {
-                "Empty Space": (0, 255, 0),  # Green for easiest
-                "Normal Space": (255, 255, 0),  # Yellow for normal
-                "We did not agree on that": (255, 165, 0),  # Orange for medium
-                "You kidding": (255, 100, 0),  # Dark orange for hard
-                "Hell No!!!": (255, 0, 0)  # Red for hardest
-            }
-            color = difficulty_colors.get(current_difficulty, (255, 255, 255))
+            color = self._difficulty_color
             
             # Create message
-            message = f"Difficulty: {current_difficulty}"
-            message_surface = self.message_font.render(message, True, color)
+            message_surface = render_cached_text(self._text_cache, self.message_font, self._difficulty_text, color)
             message_rect = message_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 50))
             
             # Create a background for better visibility
             bg_rect = message_rect.inflate(20, 10)
-            bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-            bg_surface.fill((0, 0, 0, int(200 * (alpha / 255))))  # Semi-transparent black with fade
+            bg_surface = self._get_text_background(bg_rect.size, int(200 * (alpha / 255)))  # Semi-transparent black with fade
             
             # Apply alpha to message
             message_surface.set_alpha(alpha)
@@ -528,17 +612,9 @@ class GameState:
             surface.blit(message_surface, message_rect)
             
             # Add a subtitle based on difficulty
-            difficulty_descriptions = {
-                "Empty Space": "Relaxed navigation mode",
-                "Normal Space": "Standard asteroid density",
-                "We did not agree on that": "Increased hazards ahead!",
-                "You kidding": "Seriously dangerous conditions!",
-                "Hell No!!!": "Virtually unsurvivable!"
-            }
-            
-            subtitle = difficulty_descriptions.get(current_difficulty, "")
+            subtitle = self._difficulty_description
             if subtitle:
-                subtitle_surface = self.message_font.render(subtitle, True, color)
+                subtitle_surface = render_cached_text(self._text_cache, self.message_font, subtitle, color)
                 subtitle_rect = subtitle_surface.get_rect(center=(self.screen_width // 2, message_rect.bottom + 10))
                 
                 # Apply alpha
@@ -547,38 +623,119 @@ class GameState:
                 # Draw
                 surface.blit(subtitle_surface, subtitle_rect)
             
+    def _draw_scene(self, surface):
+        """Draw the background, sprites and HUD (everything under the fade overlay).
+        
+        Args:
+            surface: Pygame surface to draw on
+        """
+        # Clear screen
+        surface.fill(BACKGROUND_COLOR)
+        
+        # Draw stars
+        self.star_field.draw(surface)
+        
+        # Draw particles
+        self.particle_system.draw(surface)
+        
+        # Draw all sprites except powerups
+        # Submit every sprite in a single blits call instead of one blit per sprite
+        surface.blits([(sprite.image, sprite.rect) for sprite in self.non_powerup_sprites.sprites()],
+                      doreturn=False)
+            
+        # Draw powerups with custom drawing
+        self.powerups.draw(surface)
+        
+        # Draw score (kept up to date by update)
+        surface.blit(self._score_surface, (10, 10))
+        
+        # Draw difficulty with color coding
+        difficulty_surface = render_cached_text(self._text_cache, self.score_font, self._difficulty_text, self._difficulty_color)
+        difficulty_rect = difficulty_surface.get_rect(topright=(self.screen_width - 10, 10))
+        
+        # Add a subtle background for better visibility
+        bg_rect = difficulty_rect.inflate(20, 10)
+        bg_rect.topright = (self.screen_width - 5, 5)
+        bg_surface = self._get_text_background(bg_rect.size, 128)  # Semi-transparent black
+        surface.blit(bg_surface, bg_rect)
+        
+        # Draw the difficulty text
+        surface.blit(difficulty_surface, difficulty_rect)
+        
+        # Draw health bar
+        self.draw_health_bar(surface)
+
+    def _update_score_surface(self):
+        """Re-render the score text if its integer value has changed."""
+        current_score = int(self.score)
+        if current_score != self._last_score_int:
+            self._score_surface = convert_text_surface(
+                self.score_font.render(f"Score: {current_score}", True, SCORE_COLOR))
+            self._last_score_int = current_score
+
+    def _get_text_background(self, size, alpha):
+        """Get a reusable black backing surface for text.
+        
+        Args:
+            size: (width, height) of the background
+            alpha: Surface alpha to apply (0-255)
+            
+        Returns:
+            Black surface with the requested alpha
+        """
+        bg_surface = self._text_bg_cache.get(size)
+        if bg_surface is None:
+            bg_surface = convert_opaque_surface(pygame.Surface(size))
+            bg_surface.fill((0, 0, 0))
+            self._text_bg_cache[size] = bg_surface
+        bg_surface.set_alpha(alpha)
+        return bg_surface
+        
+    def _create_health_bar_static(self):
+        """Pre-render the health bar background and border onto one surface.
+        
+        Returns:
+            Surface covering the bar plus its border
+        """
+        static_surface = pygame.Surface((HEALTH_BAR_WIDTH + (HEALTH_BAR_BORDER * 2),
+                                         HEALTH_BAR_HEIGHT + (HEALTH_BAR_BORDER * 2)))
+        
+        # Fill the whole surface with the border color, then the inner area with the background
+        static_surface.fill(HEALTH_BAR_BORDER_COLOR)
+        static_surface.fill(HEALTH_BAR_BACKGROUND_COLOR,
+                            (HEALTH_BAR_BORDER, HEALTH_BAR_BORDER, HEALTH_BAR_WIDTH, HEALTH_BAR_HEIGHT))
+        return convert_opaque_surface(static_surface)
+
     def draw_health_bar(self, surface):
         """Draw the player's health bar.
         
         Args:
             surface: Pygame surface to draw on
         """
-        # Position the health bar in the top left corner with a small margin
-        x = 10
-        y = self.screen_height - HEALTH_BAR_HEIGHT - 10
-        
-        # Calculate width of health portion
-        health_width = int((self.player.health / PLAYER_MAX_HEALTH) * HEALTH_BAR_WIDTH)
-        
-        # Draw background
-        pygame.draw.rect(surface, HEALTH_BAR_BACKGROUND_COLOR, 
-                        (x, y, HEALTH_BAR_WIDTH, HEALTH_BAR_HEIGHT))
-        
-        # Draw health portion
-        pygame.draw.rect(surface, HEALTH_BAR_COLOR, 
-                        (x, y, health_width, HEALTH_BAR_HEIGHT))
-        
-        # Draw border
-        pygame.draw.rect(surface, HEALTH_BAR_BORDER_COLOR, 
-                        (x - HEALTH_BAR_BORDER, y - HEALTH_BAR_BORDER, 
-                         HEALTH_BAR_WIDTH + (HEALTH_BAR_BORDER * 2), 
-                         HEALTH_BAR_HEIGHT + (HEALTH_BAR_BORDER * 2)), 
-                        HEALTH_BAR_BORDER)
-        
-        # Draw text showing exact health value
-        health_text = f"Health: {int(self.player.health)}/{PLAYER_MAX_HEALTH}"
-        health_surface = self.score_font.render(health_text, True, HEALTH_BAR_BORDER_COLOR)
-        health_rect = health_surface.get_rect(midleft=(x + 10, y + HEALTH_BAR_HEIGHT // 2))
+        # Bind per-call lookups to locals
+        health = self.player.health
+        text_cache = self._health_text_cache
+        
+        # Draw pre-rendered background and border
+        surface.blit(self._health_bar_static, self._health_bar_static_pos)
+        
+        # Draw health portion (position is precomputed, only the width changes)
+        fill_rect = self._health_fill_rect
+        fill_rect.width = int((health / PLAYER_MAX_HEALTH) * HEALTH_BAR_WIDTH)
+        pygame.draw.rect(surface, HEALTH_BAR_COLOR, fill_rect)
+        
+        # Draw text showing exact health value (re-rendered only when the value changes)
+        health_key = (int(health), PLAYER_MAX_HEALTH)
+        health_surface = text_cache.get(health_key)
+        if health_surface is None:
+            health_text = f"Health: {health_key[0]}/{health_key[1]}"
+            health_surface = convert_text_surface(
+                self.score_font.render(health_text, True, HEALTH_BAR_BORDER_COLOR))
+            if len(text_cache) >= HEALTH_TEXT_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del text_cache[next(iter(text_cache))]
+            text_cache[health_key] = health_surface
+        health_rect = health_surface.get_rect(midleft=self._health_text_anchor)
         surface.blit(health_surface, health_rect)
 
     def spawn_powerup(self):
@@ -611,16 +768,14 @@ class GameState:
 
         powerup_img = self.asset_loader.assets["powerup_imgs"].get(powerup_type_id)
         if powerup_img is None:
-            print(f"[ERROR] Image for {powerup_type_id} not found in powerup_imgs")
+            logger.error("Image for %s not found in powerup_imgs", powerup_type_id)
             return
 
         amount = details.get("amount") if powerup_type_id.startswith(POWERUP_HEALTH_ID) else None
-        new_powerup = PowerUp(
+        new_powerup = self.powerup_pool.acquire(
             (x, y),
             powerup_type_id,
             powerup_img,
-            self.screen_width,
-            self.screen_height,
             amount=amount
         )
         self.all_sprites.add(new_powerup)
@@ -631,7 +786,7 @@ class GameState:
     def check_powerup_collisions(self):
         """Check if the player has collected any power-ups and activate them."""
         # Check for collisions with power-ups
-        powerup_hits = pygame.sprite.spritecollide(self.player, self.powerups, True, pygame.sprite.collide_circle)
+        powerup_hits = pygame.sprite.spritecollide(self.player, self.powerups, True, _circles_overlap)
         
         # Process each collected power-up
         for powerup in powerup_hits:
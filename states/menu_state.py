@@ -13,6 +13,46 @@ from constants import (
 from menu.main_menu import MainMenu
 from menu.settings_menu import SettingsMenu
 from settings.settings_manager import SettingsManager
+from engine.utils import fade_in_alpha, fade_out_alpha, create_fade_surface
+
+# Particle palettes, built once instead of on every emit
+_AMBIENT_COLORS = (
+    (100, 100, 255),  # Blue
+    (100, 200, 255),  # Light blue
+    (255, 255, 255),  # White
+    (200, 100, 255),  # Purple
+)
+_GAME_START_COLORS = (
+    (100, 150, 255),  # Blue
+    (150, 200, 255),  # Light blue
+    (255, 255, 255),  # White
+)
+_MENU_TRANSITION_COLORS = ((150, 200, 255), (200, 220, 255))
+
+def _spawn_top(width, height):
+    """Ambient spawn point above the screen, drifting down."""
+    return random.randint(0, width), -20, random.uniform(100, 200)
+
+def _spawn_right(width, height):
+    """Ambient spawn point right of the screen."""
+    return width + 20, random.randint(0, height), random.uniform(-50, 50)
+
+def _spawn_bottom(width, height):
+    """Ambient spawn point below the screen, drifting up."""
+    return random.randint(0, width), height + 20, random.uniform(-200, -100)
+
+def _spawn_left(width, height):
+    """Ambient spawn point left of the screen."""
+    return -20, random.randint(0, height), random.uniform(-50, 50)
+
+# Ambient spawners, one per screen edge; each returns (x, y, direction_y)
+_EDGE_SPAWNERS = (_spawn_top, _spawn_right, _spawn_bottom, _spawn_left)
+
+# Unit direction vectors for the game-start starburst, 40 points around a circle
+_STARBURST_DIRS = tuple(
+    (math.cos(math.radians(i * (360 / 40))), math.sin(math.radians(i * (360 / 40))))
+    for i in range(40)
+)
 
 class MenuState:
     """The main menu state for the game."""
@@ -60,23 +100,29 @@ class MenuState:
         self.menu_transition_timer = 0
         self.menu_transition_duration = 0.5
         
+        # Fade overlay for the transition out (alpha set per frame)
+        self.fade_surface = create_fade_surface(self.screen_width, self.screen_height)
+        
+        # Snapshots of the outgoing and incoming menus, taken when a crossfade starts
+        self._prev_menu_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+        self._new_menu_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+        
         # Apply sound settings
         self._apply_sound_settings()
         
+        # Game music handle, looked up once so the menu-to-game switch does no asset lookups
+        self._game_music = asset_loader.get_game_assets()["music"]["game"]
+        
         # Ambient particle effects
         self.ambient_timer = 0
         self.ambient_interval = 0.8  # Seconds between ambient particle bursts
+        self.ambient_max_bursts = 4  # Most bursts caught up after a long frame
         
         print("MenuState initialized")
         
     def _apply_star_opacity(self):
         """Apply star opacity setting to the star field."""
-        opacity_percent = self.settings_manager.get_star_opacity()
-        opacity_value = int(opacity_percent * 255 / 100)
-        
-        # Apply to all stars
-        for star in self.star_field.stars:
-            star.opacity = opacity_value
+        self.star_field.set_opacity(self.settings_manager.get_star_opacity())
     
     def _apply_sound_settings(self):
         """Apply sound settings to the game."""
@@ -91,24 +137,7 @@ class MenuState:
     def _add_ambient_particles(self):
         """Add ambient particle effects."""
         # Random position near edge of screen
-        edge = random.randint(0, 3)  # 0: top, 1: right, 2: bottom, 3: left
-        
-        if edge == 0:  # Top
-            x = random.randint(0, self.screen_width)
-            y = -20
-            direction_y = random.uniform(100, 200)
-        elif edge == 1:  # Right
-            x = self.screen_width + 20
-            y = random.randint(0, self.screen_height)
-            direction_y = random.uniform(-50, 50)
-        elif edge == 2:  # Bottom
-            x = random.randint(0, self.screen_width)
-            y = self.screen_height + 20
-            direction_y = random.uniform(-200, -100)
-        else:  # Left
-            x = -20
-            y = random.randint(0, self.screen_height)
-            direction_y = random.uniform(-50, 50)
+        x, y, direction_y = random.choice(_EDGE_SPAWNERS)(self.screen_width, self.screen_height)
             
         # Calculate direction toward center with randomness
         center_x = self.screen_width // 2
@@ -116,22 +145,15 @@ class MenuState:
         
         direction_x = (center_x - x) * random.uniform(0.1, 0.3)
         
-        # Colors for ambient particles
-        colors = [
-            (100, 100, 255),  # Blue
-            (100, 200, 255),  # Light blue
-            (255, 255, 255),  # White
-            (200, 100, 255),  # Purple
-        ]
-        
-        # Emit particles
-        self.particle_system.emit_particles(
-            x, y,
-            [random.choice(colors)],
-            count=random.randint(5, 15),
-            velocity_range=((direction_x * 0.8, direction_x * 1.2), (direction_y * 0.8, direction_y * 1.2)),
+        # Emit the whole burst in one batch, each velocity jittered by +/-20%
+        count = random.randint(5, 15)
+        self.particle_system.emit_particles_batch(
+            [x] * count, [y] * count,
+            [direction_x] * count, [direction_y] * count,
+            [random.choice(_AMBIENT_COLORS)],
             size_range=(1, 3),
             lifetime_range=(3, 6),
+            velocity_jitter=0.2,
             fade=True
         )
         
@@ -152,6 +174,15 @@ class MenuState:
         result = self.active_menu.handle_event(event)
         
         # Handle menu navigation results
+        self._apply_menu_result(result)
+        return None
+        
+    def _apply_menu_result(self, result):
+        """Act on a navigation result returned by the active menu.
+        
+        Args:
+            result: State constant from the menu's handle_event or update, or None
+        """
         if result == STATE_COUNTDOWN:
             # Start game
             print("Starting game from menu")
@@ -165,30 +196,37 @@ class MenuState:
         elif result == STATE_SETTINGS:
             # Switch to settings menu with transition
             print("Switching to settings menu")
-            self.previous_menu = self.active_menu
-            self.menu_transition = True
-            self.menu_transition_timer = 0
-            
-            # Deactivate current menu during transition
-            self.active_menu.deactivate()
-            
-            # Set new menu but don't activate until transition completes
-            self.active_menu = self.settings_menu
+            self._start_menu_transition(self.settings_menu)
             
         elif result == STATE_MENU:
             # Return to main menu with transition
             print("Returning to main menu")
-            self.previous_menu = self.active_menu
-            self.menu_transition = True
-            self.menu_transition_timer = 0
-            
-            # Deactivate current menu during transition
-            self.active_menu.deactivate()
-            
-            # Set new menu but don't activate until transition completes
-            self.active_menu = self.main_menu
-            
-        return None
+            self._start_menu_transition(self.main_menu)
+        
+    def _start_menu_transition(self, next_menu):
+        """Begin a crossfade from the active menu to another menu.
+        
+        Neither menu is updated while the crossfade runs, so both are drawn
+        into their buffers once here and draw only fades the snapshots.
+        
+        Args:
+            next_menu: Menu to show once the transition completes
+        """
+        self.previous_menu = self.active_menu
+        self.menu_transition = True
+        self.menu_transition_timer = 0
+        
+        # Deactivate current menu during transition
+        self.active_menu.deactivate()
+        
+        # Set new menu but don't activate until transition completes
+        self.active_menu = next_menu
+        
+        # Snapshot both menus for the crossfade
+        self._prev_menu_surface.fill((0, 0, 0, 0))
+        self.previous_menu.draw(self._prev_menu_surface)
+        self._new_menu_surface.fill((0, 0, 0, 0))
+        self.active_menu.draw(self._new_menu_surface)
         
     def _add_game_start_effect(self):
         """Add visual effects when starting the game."""
@@ -196,37 +234,27 @@ class MenuState:
         center_x = self.screen_width // 2
         center_y = self.screen_height // 2
         
-        # Blue/white color scheme
-        colors = [
-            (100, 150, 255),  # Blue
-            (150, 200, 255),  # Light blue
-            (255, 255, 255),  # White
-        ]
-        
-        # Emit particles in a starburst pattern
-        for i in range(40):  # 40 emission points in a circle
-            angle = i * (360 / 40)
-            angle_rad = math.radians(angle)
-            
-            # Direction from center
-            dir_x = math.cos(angle_rad)
-            dir_y = math.sin(angle_rad)
-            
+        # Build a starburst pattern and emit it in a single batch
+        vel_xs = []
+        vel_ys = []
+        for dir_x, dir_y in _STARBURST_DIRS:
             # Speed with some randomness
             speed = random.uniform(250, 350)
-            vel_x = dir_x * speed
-            vel_y = dir_y * speed
             
-            # Emit several particles per angle
-            self.particle_system.emit_particles(
-                center_x, center_y,
-                colors,
-                count=4,
-                velocity_range=((vel_x * 0.9, vel_x * 1.1), (vel_y * 0.9, vel_y * 1.1)),
-                size_range=(2, 4),
-                lifetime_range=(0.8, 1.5),
-                fade=True
-            )
+            # Several particles per angle
+            vel_xs.extend([dir_x * speed] * 4)
+            vel_ys.extend([dir_y * speed] * 4)
+        
+        count = len(vel_xs)
+        self.particle_system.emit_particles_batch(
+            [center_x] * count, [center_y] * count,
+            vel_xs, vel_ys,
+            _GAME_START_COLORS,
+            size_range=(2, 4),
+            lifetime_range=(0.8, 1.5),
+            velocity_jitter=0.1,
+            fade=True
+        )
         
     def update(self, dt):
         """Update the menu state.
@@ -237,11 +265,15 @@ class MenuState:
         Returns:
             STATE_COUNTDOWN if transition complete, None otherwise
         """
-        # Update stars
-        self.star_field.update(dt)
+        # Background effects are invisible while the window is minimized, so skip them
+        window_visible = pygame.display.get_active()
         
-        # Update particles
-        self.particle_system.update(dt)
+        if window_visible:
+            # Update stars
+            self.star_field.update(dt)
+            
+            # Update particles
+            self.particle_system.update(dt)
         
         # Handle menu transitions
         if self.menu_transition:
@@ -257,64 +289,40 @@ class MenuState:
                 
             return None
         
-        # Update the active menu
-        menu_result = self.active_menu.update(dt)
-        
-        # Handle menu update results
-        if menu_result == STATE_COUNTDOWN:
-            self.transition_out = True
-            self.transition_timer = 0
-            self.transition_target = STATE_COUNTDOWN
-            
-            # Add visual effect for game start
-            self._add_game_start_effect()
-            
-        elif menu_result == STATE_SETTINGS:
-            # Switch to settings menu
-            self.previous_menu = self.active_menu
-            self.menu_transition = True
-            self.menu_transition_timer = 0
-            
-            # Deactivate current menu during transition
-            self.active_menu.deactivate()
-            
-            # Set new menu but don't activate until transition completes
-            self.active_menu = self.settings_menu
-            
-        elif menu_result == STATE_MENU:
-            # Return to main menu
-            self.previous_menu = self.active_menu
-            self.menu_transition = True
-            self.menu_transition_timer = 0
-            
-            # Deactivate current menu during transition
-            self.active_menu.deactivate()
-            
-            # Set new menu but don't activate until transition completes
-            self.active_menu = self.main_menu
+        # Update the active menu and handle its results
+        self._apply_menu_result(self.active_menu.update(dt))
             
         # Handle transition out if active
         if self.transition_out:
             self.transition_timer += dt
-            self.fade_alpha = min(255, int(255 * (self.transition_timer / FADE_DURATION)))
+            self.fade_alpha = fade_in_alpha(self.transition_timer, FADE_DURATION)
             
             # If transition complete, change to target state
             if self.transition_timer >= FADE_DURATION:
                 # Change the music if going to game
                 if self.transition_target == STATE_COUNTDOWN:
                     print("Menu transition complete - switching to countdown")
+                    if self.settings_manager.get_sound_enabled():
+                        music_volume = 0.5
+                    else:
+                        music_volume = 0.0
                     self.asset_loader.play_music(
-                        self.asset_loader.load_game_assets()["music"]["game"],
-                        volume=self.settings_manager.get_sound_enabled() and 0.5 or 0.0,
+                        self._game_music,
+                        volume=music_volume,
                         fade_ms=MUSIC_FADE_DURATION
                     )
                 return self.transition_target
         
         # Add ambient particles occasionally
+        if not window_visible:
+            return None
         self.ambient_timer += dt
         if self.ambient_timer >= self.ambient_interval:
-            self.ambient_timer = 0
-            self._add_ambient_particles()
+            # Keep the overshoot so the long-run burst rate doesn't drift with frame timing
+            bursts = min(int(self.ambient_timer // self.ambient_interval), self.ambient_max_bursts)
+            self.ambient_timer %= self.ambient_interval
+            for _ in range(bursts):
+                self._add_ambient_particles()
                 
         return None
         
@@ -327,15 +335,12 @@ class MenuState:
         # Create particles along a horizontal line in the middle
         y = height // 2
         for x in range(0, width + 1, 20):  # Every 20 pixels
-            # Emit particles
-            colors = [(150, 200, 255), (200, 220, 255)]
-            
             # Random upward/downward velocities
             vel_y = random.uniform(-80, 80)
             
             self.particle_system.emit_particles(
                 x, y,
-                colors,
+                _MENU_TRANSITION_COLORS,
                 count=3,
                 velocity_range=((-20, 20), (vel_y * 0.8, vel_y * 1.2)),
                 size_range=(1, 3),
@@ -360,21 +365,18 @@ class MenuState:
         
         if self.menu_transition:
             # During menu transition, fade between menus
-            progress = self.menu_transition_timer / self.menu_transition_duration
+            elapsed = self.menu_transition_timer
+            duration = self.menu_transition_duration
             
-            # If we have a previous menu, draw it fading out
+            # If we have a previous menu, draw its snapshot fading out
             if self.previous_menu:
-                # Draw with fading alpha
-                fade_alpha = int(255 * (1 - progress))
-                prev_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-                self.previous_menu.draw(prev_surface)
-                prev_surface.set_alpha(fade_alpha)
+                prev_surface = self._prev_menu_surface
+                prev_surface.set_alpha(fade_out_alpha(elapsed, duration))
                 surface.blit(prev_surface, (0, 0))
             
-            # Draw the new menu fading in
-            new_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            self.active_menu.draw(new_surface)
-            new_surface.set_alpha(int(255 * progress))
+            # Draw the new menu's snapshot fading in
+            new_surface = self._new_menu_surface
+            new_surface.set_alpha(fade_in_alpha(elapsed, duration))
             surface.blit(new_surface, (0, 0))
         else:
             # Normal menu drawing
@@ -382,6 +384,5 @@ class MenuState:
         
         # Draw fade effect during transition out
         if self.transition_out and self.fade_alpha > 0:
-            fade_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            fade_surface.fill((0, 0, 0, self.fade_alpha))
-            surface.blit(fade_surface, (0, 0)) 
\ No newline at end of file
+            self.fade_surface.set_alpha(self.fade_alpha)
+            surface.blit(self.fade_surface, (0, 0)) 
\ No newline at end of file